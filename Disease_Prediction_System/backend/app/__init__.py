@@ -11,6 +11,7 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_mail import Mail
 from redis import Redis
+from app.utils.json_provider import OrjsonProvider
 import logging
 import os
 from dotenv import load_dotenv
@@ -35,6 +36,7 @@ def create_app(config_object='app.config.Config'):
     Application factory function
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Load configuration
     app.config.from_object(config_object)
@@ -0,0 +1,19 @@
+"""
+Health check endpoint
+"""
+
+from flask import Blueprint, jsonify
+from datetime import datetime
+
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('', methods=['GET'])
+def health():
+    """
+    Liveness check used by deploy.sh and the load balancer
+    """
+    return jsonify({
+        'status': 'healthy',
+        'timestamp': datetime.now().isoformat(),
+        'service': 'Disease Prediction API'
+    })
@@ -2,15 +2,23 @@
 Prediction API endpoints
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.services.ml_service import MLService
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import case
+from app import redis_client
+from app.services.ml_service import MLService, RISK_BINS
 from app.services.prediction_service import PredictionService
 from app.services.explanation_service import ExplanationService
+from app.services.prediction_writer import PredictionWriter
 from app.models import Prediction, db
-from app.utils.validators import validate_heart_data, validate_diabetes_data, validate_cancer_data
+from app.utils.schemas import HeartInput, DiabetesInput, CancerInput
 from app.utils.decorators import rate_limit
+from datetime import datetime
+import hashlib
 import logging
+import orjson
 
 predictions_bp = Blueprint('predictions', __name__)
 logger = logging.getLogger(__name__)
@@ -19,148 +27,115 @@ ml_service = MLService()
 prediction_service = PredictionService()
 explanation_service = ExplanationService()
 
-@predictions_bp.route('/heart', methods=['POST'])
-@jwt_required()
-@rate_limit(limit=100, period=3600)  # 100 requests per hour
-def predict_heart():
+# Input schema per supported disease; also defines the /<disease_type> routes
+DISEASE_SCHEMAS = {
+    'heart': HeartInput,
+    'diabetes': DiabetesInput,
+    'cancer': CancerInput
+}
+
+# Prediction records are buffered and bulk-inserted off the request path
+prediction_writer = PredictionWriter()
+
+# Model + SHAP output for identical inputs is reused for an hour
+PREDICTION_CACHE_TTL = 3600
+
+def _predict_with_cache(disease_type, data):
     """
-    Predict heart disease
+    Run the model and SHAP explanation, reusing cached results for identical inputs.
+    Only inference is cached - callers still record every request in history.
     """
+    digest = hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    key = f"pred:{disease_type}:{digest}"
+    
     try:
-        data = request.get_json()
-        
-        # Validate input data
-        is_valid, errors = validate_heart_data(data)
-        if not is_valid:
-            return jsonify({'error': 'Validation failed', 'details': errors}), 400
-        
-        # Make prediction
-        prediction = ml_service.predict_heart(data)
-        
-        # Get SHAP explanation
-        explanation = explanation_service.get_shap_values('heart', data)
-        
-        # Save to database
-        user_id = get_jwt_identity()
-        prediction_record = Prediction(
-            user_id=user_id,
-            disease_type='heart',
-            input_data=data,
-            result=prediction['prediction'],
-            probability=prediction['probability'],
-            explanation=explanation
-        )
-        db.session.add(prediction_record)
-        db.session.commit()
-        
-        # Log prediction
-        logger.info(f"Heart disease prediction made by user {user_id}: {prediction}")
-        
-        return jsonify({
-            'success': True,
-            'prediction': prediction['prediction'],
-            'probability': prediction['probability'],
-            'risk_level': prediction['risk_level'],
-            'explanation': explanation,
-            'id': prediction_record.id,
-            'timestamp': prediction_record.created_at.isoformat()
-        }), 200
-        
-    except Exception as e:
-        logger.error(f"Prediction error: {str(e)}")
-        return jsonify({'error': 'Prediction failed', 'message': str(e)}), 500
+        cached = redis_client.get(key)
+    except RedisError as e:
+        logger.warning(f"Prediction cache read failed: {str(e)}")
+        cached = None
+    
+    if cached is not None:
+        cached = orjson.loads(cached)
+        return cached['prediction'], cached['explanation']
+    
+    prediction = ml_service.predict(disease_type, data)
+    explanation = explanation_service.get_shap_values(disease_type, data)
+    
+    try:
+        redis_client.setex(key, PREDICTION_CACHE_TTL, orjson.dumps(
+            {'prediction': prediction, 'explanation': explanation},
+            option=orjson.OPT_SERIALIZE_NUMPY
+        ))
+    except RedisError as e:
+        logger.warning(f"Prediction cache write failed: {str(e)}")
+    
+    return prediction, explanation
 
-@predictions_bp.route('/diabetes', methods=['POST'])
-@jwt_required()
-@rate_limit(limit=100, period=3600)
-def predict_diabetes():
+def _save_prediction(disease_type, data, prediction, explanation):
     """
-    Predict diabetes
+    Queue a prediction record for saving and return it immediately.
+    The timestamp is generated here so the response does not wait on the
+    database; the integer id is assigned when the row is inserted with the
+    next batch.
     """
-    try:
-        data = request.get_json()
-        
-        # Validate input data
-        is_valid, errors = validate_diabetes_data(data)
-        if not is_valid:
-            return jsonify({'error': 'Validation failed', 'details': errors}), 400
-        
-        # Make prediction
-        prediction = ml_service.predict_diabetes(data)
-        
-        # Get SHAP explanation
-        explanation = explanation_service.get_shap_values('diabetes', data)
-        
-        # Save to database
-        user_id = get_jwt_identity()
-        prediction_record = Prediction(
-            user_id=user_id,
-            disease_type='diabetes',
-            input_data=data,
-            result=prediction['prediction'],
-            probability=prediction['probability'],
-            explanation=explanation
-        )
-        db.session.add(prediction_record)
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'prediction': prediction['prediction'],
-            'probability': prediction['probability'],
-            'risk_level': prediction['risk_level'],
-            'explanation': explanation,
-            'id': prediction_record.id,
-            'timestamp': prediction_record.created_at.isoformat()
-        }), 200
-        
-    except Exception as e:
-        logger.error(f"Prediction error: {str(e)}")
-        return jsonify({'error': 'Prediction failed', 'message': str(e)}), 500
+    record = {
+        'user_id': get_jwt_identity(),
+        'disease_type': disease_type,
+        'input_data': data,
+        'result': prediction['prediction'],
+        'probability': prediction['probability'],
+        'explanation': explanation,
+        'created_at': datetime.utcnow()
+    }
+    prediction_writer.submit(current_app._get_current_object(), record)
+    return record
 
-@predictions_bp.route('/cancer', methods=['POST'])
+def _stream_prediction_response(body, explanation):
+    """
+    Stream a prediction response: the small fields go out first, then the
+    SHAP explanation is encoded and sent as its own chunk.
+    """
+    def generate():
+        head = orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+        yield head[:-1] + b',"explanation":'
+        yield orjson.dumps(explanation, option=orjson.OPT_SERIALIZE_NUMPY)
+        yield b'}'
+    
+    return Response(generate(), status=200, mimetype='application/json')
+
+@predictions_bp.route(f"/<any({', '.join(DISEASE_SCHEMAS)}):disease_type>", methods=['POST'])
 @jwt_required()
-@rate_limit(limit=100, period=3600)
-def predict_cancer():
+@rate_limit(limit=100, period=3600)  # 100 requests per hour
+def predict(disease_type):
     """
-    Predict breast cancer
+    Predict heart disease, diabetes or breast cancer
+
+    The record is saved in the background, so the response carries no id;
+    it appears in /history (with its id) after the next batch insert. If
+    the database keeps rejecting it, the record is written to the writer's
+    dead-letter file instead and is missing from history until replayed.
     """
     try:
-        data = request.get_json()
-        
         # Validate input data
-        is_valid, errors = validate_cancer_data(data)
-        if not is_valid:
-            return jsonify({'error': 'Validation failed', 'details': errors}), 400
-        
-        # Make prediction
-        prediction = ml_service.predict_cancer(data)
+        try:
+            schema = DISEASE_SCHEMAS[disease_type]
+            data = schema.model_validate(request.get_json()).model_dump(by_alias=True)
+        except ValidationError as e:
+            return jsonify({'error': 'Validation failed', 'details': e.errors(include_url=False)}), 400
         
-        # Get SHAP explanation
-        explanation = explanation_service.get_shap_values('cancer', data)
+        # Make prediction + SHAP explanation (cached by input hash)
+        prediction, explanation = _predict_with_cache(disease_type, data)
         
-        # Save to database
-        user_id = get_jwt_identity()
-        prediction_record = Prediction(
-            user_id=user_id,
-            disease_type='cancer',
-            input_data=data,
-            result=prediction['prediction'],
-            probability=prediction['probability'],
-            explanation=explanation
-        )
-        db.session.add(prediction_record)
-        db.session.commit()
+        # Save to database (in the background)
+        prediction_record = _save_prediction(disease_type, data, prediction, explanation)
         
-        return jsonify({
+        return _stream_prediction_response({
             'success': True,
             'prediction': prediction['prediction'],
             'probability': prediction['probability'],
             'risk_level': prediction['risk_level'],
-            'explanation': explanation,
-            'id': prediction_record.id,
-            'timestamp': prediction_record.created_at.isoformat()
-        }), 200
+            'timestamp': prediction_record['created_at'].isoformat()
+        }, explanation)
         
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}")
@@ -177,26 +152,37 @@ def get_prediction_history():
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
         disease_type = request.args.get('disease_type')
-        
-        query = Prediction.query.filter_by(user_id=user_id)
+        include_details = request.args.get('include_details', 'false').lower() in ('1', 'true', 'yes')
+        # The total needs a COUNT(*) over the same filter; clients paging
+        # with "next" links can skip it
+        include_total = request.args.get('include_total', 'true').lower() in ('1', 'true', 'yes')
+        
+        # Risk label is computed by the database; heavy JSON columns are
+        # only selected when explicitly requested
+        risk_level = case(
+            (Prediction.probability > float(RISK_BINS[1]), 'High'),
+            (Prediction.probability > float(RISK_BINS[0]), 'Medium'),
+            else_='Low'
+        ).label('risk_level')
+        columns = [Prediction.id, Prediction.disease_type, Prediction.result,
+                   Prediction.probability, risk_level, Prediction.created_at]
+        if include_details:
+            columns += [Prediction.input_data, Prediction.explanation]
+        
+        query = db.session.query(*columns).filter(Prediction.user_id == user_id)
         
         if disease_type:
-            query = query.filter_by(disease_type=disease_type)
+            query = query.filter(Prediction.disease_type == disease_type)
         
         pagination = query.order_by(Prediction.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+            page=page, per_page=per_page, error_out=False, count=include_total
         )
         
-        predictions = [{
-            'id': p.id,
-            'disease_type': p.disease_type,
-            'input_data': p.input_data,
-            'result': p.result,
-            'probability': p.probability,
-            'risk_level': 'High' if p.probability > 0.7 else 'Medium' if p.probability > 0.4 else 'Low',
-            'explanation': p.explanation,
-            'created_at': p.created_at.isoformat()
-        } for p in pagination.items]
+        predictions = []
+        for row in pagination.items:
+            item = row._asdict()
+            item['created_at'] = row.created_at.isoformat()
+            predictions.append(item)
         
         return jsonify({
             'predictions': predictions,
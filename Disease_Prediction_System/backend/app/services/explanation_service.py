@@ -0,0 +1,104 @@
+"""
+SHAP explanation service for model predictions
+"""
+
+import joblib
+import numpy as np
+import shap
+from app.services.ml_service import DISEASE_NAMES, MODEL_PATH
+from sklearn.ensemble import (ExtraTreesClassifier, GradientBoostingClassifier,
+                              RandomForestClassifier)
+from sklearn.linear_model import LogisticRegression
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+TREE_MODELS = (RandomForestClassifier, ExtraTreesClassifier, GradientBoostingClassifier)
+
+# ~100 raw training rows saved next to the model (also used for int8 calibration)
+BACKGROUND_FILE = 'calibration.npy'
+
+class ExplanationService:
+    """Service for computing per-prediction SHAP feature contributions"""
+
+    def __init__(self):
+        self.explainers = {}
+        self.scalers = {}
+        self.features = {}
+        self._lock = threading.Lock()
+
+    def load_explainers(self):
+        """Build the explainer for every disease up front"""
+        for disease_type, name in DISEASE_NAMES.items():
+            try:
+                self._ensure_loaded(disease_type)
+                logger.info(f"✅ {name} explainer ready")
+            except Exception as e:
+                logger.error(f"Failed to build {disease_type} explainer: {e}")
+
+    def _ensure_loaded(self, disease_type):
+        """Build a disease explainer once; every request reuses it"""
+        if disease_type in self.explainers:
+            return
+        with self._lock:
+            if disease_type not in self.explainers:
+                self._load(disease_type)
+
+    def _load(self, disease_type):
+        """Load the model and build its explainer over a fixed background sample"""
+        if disease_type not in DISEASE_NAMES:
+            raise ValueError(f"Unknown disease type: {disease_type}")
+
+        disease_path = MODEL_PATH / disease_type
+        model = joblib.load(disease_path / 'model.pkl', mmap_mode='r')
+        scaler = joblib.load(disease_path / 'scaler.pkl', mmap_mode='r')
+        features = joblib.load(disease_path / 'features.pkl')
+
+        if isinstance(model, TREE_MODELS) or type(model).__name__ == 'XGBClassifier':
+            explainer = shap.TreeExplainer(model)
+        else:
+            background_path = disease_path / BACKGROUND_FILE
+            if background_path.exists():
+                background = scaler.transform(np.load(background_path))
+            else:
+                # Single row at the training mean (zero in standardized space)
+                background = np.zeros((1, len(features)))
+
+            if isinstance(model, LogisticRegression):
+                explainer = shap.LinearExplainer(model, background)
+            else:
+                explainer = shap.KernelExplainer(model.predict_proba, background)
+
+        self.scalers[disease_type] = scaler
+        self.features[disease_type] = features
+        self.explainers[disease_type] = explainer
+
+    def get_shap_values(self, disease_type, data):
+        """
+        Explain a single prediction
+
+        Returns:
+            dict: base value and per-feature SHAP contributions for the positive class
+        """
+        self._ensure_loaded(disease_type)
+        features = self.features[disease_type]
+
+        x = np.array([[data[name] for name in features]], dtype=np.float64)
+        scaled = self.scalers[disease_type].transform(x)
+
+        explainer = self.explainers[disease_type]
+        values = explainer.shap_values(scaled)
+
+        # Classifiers return per-class outputs either as a list or a trailing axis
+        if isinstance(values, list):
+            values = values[-1]
+        values = np.asarray(values)
+        if values.ndim == 3:
+            values = values[..., -1]
+        base_value = np.ravel(explainer.expected_value)[-1]
+
+        return {
+            'base_value': float(base_value),
+            'feature_contributions': dict(zip(features, values[0].tolist()))
+        }
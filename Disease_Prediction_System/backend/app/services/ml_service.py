@@ -4,146 +4,344 @@ Machine Learning service for model inference
 
 import joblib
 import numpy as np
-import pandas as pd
 from pathlib import Path
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from concurrent.futures import Future
 import logging
+import queue
+import threading
+import time
+
+try:
+    import onnxruntime as ort
+except ImportError:  # fall back to the joblib pickles
+    ort = None
+
+try:
+    import treelite_runtime
+except ImportError:
+    treelite_runtime = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+DISEASE_NAMES = {
+    'heart': 'Heart disease',
+    'diabetes': 'Diabetes',
+    'cancer': 'Cancer'
+}
+
+# Response keys for the [negative, positive] class probabilities
+PROBABILITY_LABELS = {
+    'heart': ('no_disease', 'disease'),
+    'diabetes': ('no_diabetes', 'diabetes'),
+    'cancer': ('benign', 'malignant')
+}
+
+# Compiled tree-ensemble library written by src/models/export.py
+TREELITE_LIB = 'predictor.so'
+
+# Tensor names written by src/models/export.py
+ONNX_INPUT = 'input'
+ONNX_PROBA_OUTPUT = 'output_probability'
+
+# Risk thresholds: Low < 0.4 <= Medium < 0.7 <= High
+RISK_LABELS = np.array(['Low', 'Medium', 'High'])
+RISK_BINS = np.array([0.4, 0.7])
+
+def risk_levels(probabilities):
+    """Vectorized Low/Medium/High labelling of an array of probabilities"""
+    return RISK_LABELS[np.digitize(probabilities, RISK_BINS)]
+
+MODEL_PATH = Path(__file__).parent.parent / 'ml_models'
+
+# Micro-batching defaults: concurrent single-row requests arriving within
+# BATCH_TIMEOUT seconds are coalesced into one predict_proba call.
+MAX_BATCH_SIZE = 64
+BATCH_TIMEOUT = 0.005
+
 class MLService:
     """Service for loading ML models and making predictions"""
     
-    def __init__(self):
+    def __init__(self, max_batch_size=MAX_BATCH_SIZE, batch_timeout=BATCH_TIMEOUT):
         self.models = {}
         self.scalers = {}
+        self._scale_fn = {}
         self.features = {}
-        self.load_models()
+        self.sessions = {}
+        self._linear = {}
+        self.compiled = {}
+        self._feat_idx = {}
+        self._n_feat = {}
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout
+        self._queues = {}
+        self._workers = {}
+        self._lock = threading.Lock()
+        # Models are loaded lazily on first use; call load_models() to warm up eagerly
     
     def load_models(self):
         """Load all saved models"""
-        model_path = Path(__file__).parent.parent / 'ml_models'
+        for disease_type, name in DISEASE_NAMES.items():
+            try:
+                self._ensure_loaded(disease_type)
+                logger.info(f"✅ {name} model loaded")
+            except Exception as e:
+                logger.error(f"Failed to load {disease_type} model: {e}")
+    
+    def _ensure_loaded(self, disease_type):
+        """Load a disease model on first use"""
+        if disease_type in self.features:
+            return
+        with self._lock:
+            if disease_type not in self.features:
+                self._load(disease_type)
+    
+    def _load(self, disease_type):
+        """
+        Load one disease's model files. Pickles are memory-mapped read-only, so
+        workers forked from a preloaded master share the pages; this requires
+        them to be saved with joblib.dump(..., compress=0).
+        """
+        if disease_type not in DISEASE_NAMES:
+            raise ValueError(f"Unknown disease type: {disease_type}")
         
-        # Load heart disease models
-        try:
-            self.models['heart'] = joblib.load(model_path / 'heart' / 'model.pkl')
-            self.scalers['heart'] = joblib.load(model_path / 'heart' / 'scaler.pkl')
-            self.features['heart'] = joblib.load(model_path / 'heart' / 'features.pkl')
-            logger.info("✅ Heart disease model loaded")
-        except Exception as e:
-            logger.error(f"Failed to load heart model: {e}")
+        disease_path = MODEL_PATH / disease_type
+        features = joblib.load(disease_path / 'features.pkl')
         
-        # Load diabetes models
-        try:
-            self.models['diabetes'] = joblib.load(model_path / 'diabetes' / 'model.pkl')
-            self.scalers['diabetes'] = joblib.load(model_path / 'diabetes' / 'scaler.pkl')
-            self.features['diabetes'] = joblib.load(model_path / 'diabetes' / 'features.pkl')
-            logger.info("✅ Diabetes model loaded")
-        except Exception as e:
-            logger.error(f"Failed to load diabetes model: {e}")
+        model = joblib.load(disease_path / 'model.pkl', mmap_mode='r')
+        scaler = joblib.load(disease_path / 'scaler.pkl', mmap_mode='r')
         
-        # Load cancer models
-        try:
-            self.models['cancer'] = joblib.load(model_path / 'cancer' / 'model.pkl')
-            self.scalers['cancer'] = joblib.load(model_path / 'cancer' / 'scaler.pkl')
-            self.features['cancer'] = joblib.load(model_path / 'cancer' / 'features.pkl')
-            logger.info("✅ Cancer model loaded")
-        except Exception as e:
-            logger.error(f"Failed to load cancer model: {e}")
+        # Prefer the int8-quantized graph, then the FP32 export
+        onnx_path = next((p for p in (disease_path / 'model.int8.onnx',
+                                      disease_path / 'model.onnx') if p.exists()), None)
+        
+        if self._can_fuse_linear(model, scaler):
+            # A single dot product beats any runtime call for linear models
+            self._linear[disease_type] = self._fuse_linear(model, scaler)
+            self.models[disease_type] = model
+        elif treelite_runtime is not None and (disease_path / TREELITE_LIB).exists():
+            # Trees compiled to native code; they still expect scaled input
+            self.compiled[disease_type] = treelite_runtime.Predictor(
+                str(disease_path / TREELITE_LIB), nthread=1
+            )
+            self.models[disease_type] = model
+            self.scalers[disease_type] = scaler
+            self._scale_fn[disease_type] = self._specialize_scaler(scaler)
+        elif ort is not None and onnx_path is not None:
+            # Scaler + classifier are fused into a single ONNX graph
+            self.sessions[disease_type] = ort.InferenceSession(
+                str(onnx_path),
+                sess_options=self._session_options(),
+                providers=['CPUExecutionProvider']
+            )
+        else:
+            self.models[disease_type] = model
+            self.scalers[disease_type] = scaler
+            self._scale_fn[disease_type] = self._specialize_scaler(scaler)
+        
+        # Precompute column positions so requests can be packed straight into ndarrays
+        self._feat_idx[disease_type] = {name: i for i, name in enumerate(features)}
+        self._n_feat[disease_type] = len(features)
+        
+        # Published last: other threads treat a present feature list as "loaded"
+        self.features[disease_type] = features
     
-    def predict_heart(self, data):
-        """Predict heart disease"""
-        try:
-            # Convert to DataFrame
-            df = pd.DataFrame([data])
-            df = df[self.features['heart']]  # Ensure correct order
-            
-            # Scale features
-            scaled = self.scalers['heart'].transform(df)
-            
-            # Make prediction
-            pred = self.models['heart'].predict(scaled)[0]
-            proba = self.models['heart'].predict_proba(scaled)[0]
-            
-            # Determine risk level
-            risk_prob = proba[1] if pred == 1 else proba[0]
-            if risk_prob >= 0.7:
-                risk_level = "High"
-            elif risk_prob >= 0.4:
-                risk_level = "Medium"
-            else:
-                risk_level = "Low"
-            
-            return {
-                'prediction': int(pred),
-                'probability': float(risk_prob),
-                'risk_level': risk_level,
-                'probabilities': {
-                    'no_disease': float(proba[0]),
-                    'disease': float(proba[1])
-                }
-            }
-        except Exception as e:
-            logger.error(f"Heart prediction error: {e}")
-            raise
+    def _get_queue(self, disease_type):
+        """Return the disease's batching queue, starting its worker thread on first use"""
+        requests = self._queues.get(disease_type)
+        if requests is not None:
+            return requests
+        
+        with self._lock:
+            if disease_type not in self._queues:
+                requests = queue.Queue()
+                worker = threading.Thread(
+                    target=self._batch_worker,
+                    args=(disease_type, requests),
+                    name=f"ml-batch-{disease_type}",
+                    daemon=True
+                )
+                worker.start()
+                self._workers[disease_type] = worker
+                self._queues[disease_type] = requests
+            return self._queues[disease_type]
+    
+    @staticmethod
+    def _specialize_scaler(scaler):
+        """
+        Turn a fitted StandardScaler into a fixed (x - mean) / scale kernel with
+        its statistics baked in as constants (Numba-compiled when available).
+        Other scalers keep their generic transform.
+        """
+        if not isinstance(scaler, StandardScaler):
+            return scaler.transform
+        
+        n_features = scaler.n_features_in_
+        mean = (scaler.mean_ if scaler.mean_ is not None else np.zeros(n_features)).astype(np.float32)
+        scale = (scaler.scale_ if scaler.scale_ is not None else np.ones(n_features)).astype(np.float32)
+        
+        def scale_features(x):
+            return (x - mean) / scale
+        
+        if njit is not None:
+            # Closures over arrays can't use cache=True; compile now instead of on first request
+            scale_features = njit(fastmath=True)(scale_features)
+            scale_features(np.zeros((1, n_features), dtype=np.float32))
+        return scale_features
     
-    def predict_diabetes(self, data):
-        """Predict diabetes"""
+    @staticmethod
+    def _can_fuse_linear(model, scaler):
+        """Binary logistic regression behind a StandardScaler can be folded into one affine map"""
+        return (isinstance(model, LogisticRegression) and isinstance(scaler, StandardScaler)
+                and model.coef_.shape[0] == 1)
+    
+    @staticmethod
+    def _fuse_linear(model, scaler):
+        """
+        Fold (x - mean) / scale into the LR weights:
+        w' = w / scale, b' = b - w' . mean
+        """
+        mean = scaler.mean_ if scaler.mean_ is not None else 0.0
+        scale = scaler.scale_ if scaler.scale_ is not None else 1.0
+        weights = model.coef_[0] / scale
+        bias = model.intercept_[0] - np.dot(weights, mean)
+        return weights.astype(np.float32), np.float32(bias)
+    
+    def _predict_linear(self, disease_type, x):
+        """Class probabilities from the fused linear model: one dot product + sigmoid"""
+        weights, bias = self._linear[disease_type]
+        positive = 1.0 / (1.0 + np.exp(-(x @ weights + bias)))
+        return np.column_stack((1.0 - positive, positive))
+    
+    def _predict_compiled(self, disease_type, scaled):
+        """Class probabilities from the Treelite-compiled tree ensemble"""
+        proba = self.compiled[disease_type].predict(treelite_runtime.DMatrix(scaled))
+        if proba.ndim == 1:
+            # Binary models only emit the positive-class probability
+            proba = np.column_stack((1.0 - proba, proba))
+        return proba
+    
+    @staticmethod
+    def _session_options():
+        """ONNX Runtime options: one intra-op thread, parallelism comes from gunicorn"""
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return options
+    
+    def _batch_worker(self, disease_type, requests):
+        """Drain queued requests and run them through the model in batches"""
+        while True:
+            batch = [requests.get()]
+            deadline = time.monotonic() + self.batch_timeout
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._run_batch(disease_type, batch)
+    
+    def _run_batch(self, disease_type, batch):
+        """Score a batch of (data, future) pairs with one predict_proba call"""
+        feat_idx = self._feat_idx[disease_type]
+        x = np.empty((len(batch), self._n_feat[disease_type]), dtype=np.float32)
+        pending = []
+        
+        # Build the batch ordered by the training feature list; a malformed
+        # request only fails its own future
+        for data, future in batch:
+            row = x[len(pending)]
+            try:
+                for name, i in feat_idx.items():
+                    row[i] = data[name]
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            pending.append(future)
+        
+        if not pending:
+            return
+        
         try:
-            df = pd.DataFrame([data])
-            df = df[self.features['diabetes']]
-            scaled = self.scalers['diabetes'].transform(df)
-            pred = self.models['diabetes'].predict(scaled)[0]
-            proba = self.models['diabetes'].predict_proba(scaled)[0]
-            
-            risk_prob = proba[1] if pred == 1 else proba[0]
-            risk_level = "High" if risk_prob >= 0.7 else "Medium" if risk_prob >= 0.4 else "Low"
-            
-            return {
-                'prediction': int(pred),
-                'probability': float(risk_prob),
-                'risk_level': risk_level,
-                'probabilities': {
-                    'no_diabetes': float(proba[0]),
-                    'diabetes': float(proba[1])
-                }
-            }
+            proba = self._infer(disease_type, x[:len(pending)])
         except Exception as e:
-            logger.error(f"Diabetes prediction error: {e}")
-            raise
+            for future in pending:
+                future.set_exception(e)
+            return
+        
+        # Risk level from the predicted class probability, for the whole batch at once
+        levels = risk_levels(proba.max(axis=1)).tolist()
+        for future, row, level in zip(pending, proba, levels):
+            future.set_result((row, level))
+    
+    def _infer(self, disease_type, x):
+        """Return class probabilities for a float32 feature batch"""
+        if disease_type in self._linear:
+            return self._predict_linear(disease_type, x)
+        if disease_type in self.sessions:
+            return self.sessions[disease_type].run([ONNX_PROBA_OUTPUT], {ONNX_INPUT: x})[0]
+        scaled = self._scale_fn[disease_type](x)
+        if disease_type in self.compiled:
+            return self._predict_compiled(disease_type, scaled)
+        return self.models[disease_type].predict_proba(scaled)
     
-    def predict_cancer(self, data):
-        """Predict breast cancer"""
+    def _predict_row(self, disease_type, data):
+        """Queue a single row for batched inference and wait for (probabilities, risk level)"""
+        self._ensure_loaded(disease_type)
+        future = Future()
+        self._get_queue(disease_type).put((data, future))
+        return future.result()
+    
+    def predict(self, disease_type, data):
+        """Predict disease risk for a single patient record"""
         try:
-            df = pd.DataFrame([data])
-            df = df[self.features['cancer']]
-            scaled = self.scalers['cancer'].transform(df)
-            pred = self.models['cancer'].predict(scaled)[0]
-            proba = self.models['cancer'].predict_proba(scaled)[0]
-            
-            risk_prob = proba[1] if pred == 1 else proba[0]
-            risk_level = "High" if risk_prob >= 0.7 else "Medium" if risk_prob >= 0.4 else "Low"
+            # Make prediction (batched with concurrent requests)
+            proba, risk_level = self._predict_row(disease_type, data)
+            pred = int(np.argmax(proba))
+            risk_prob = proba[pred]
+            negative, positive = PROBABILITY_LABELS[disease_type]
             
             return {
-                'prediction': int(pred),
+                'prediction': pred,
                 'probability': float(risk_prob),
                 'risk_level': risk_level,
                 'probabilities': {
-                    'benign': float(proba[0]),
-                    'malignant': float(proba[1])
+                    negative: proba[0],
+                    positive: proba[1]
                 }
             }
         except Exception as e:
-            logger.error(f"Cancer prediction error: {e}")
+            logger.error(f"{DISEASE_NAMES.get(disease_type, disease_type)} prediction error: {e}")
             raise
     
     def get_model_info(self, disease_type):
         """Get model information"""
-        if disease_type not in self.models:
+        try:
+            self._ensure_loaded(disease_type)
+        except Exception as e:
+            logger.error(f"Failed to load {disease_type} model: {e}")
             return None
         
-        model = self.models[disease_type]
+        if disease_type in self._linear:
+            model, runtime = self.models[disease_type], 'fused-linear'
+        elif disease_type in self.compiled:
+            model, runtime = self.models[disease_type], 'treelite'
+        elif disease_type in self.sessions:
+            model, runtime = self.sessions[disease_type], 'onnxruntime'
+        else:
+            model, runtime = self.models[disease_type], 'sklearn'
         return {
             'type': type(model).__name__,
+            'runtime': runtime,
             'features': self.features[disease_type],
             'n_features': len(self.features[disease_type])
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,126 @@
+"""
+Buffered writer for prediction records
+"""
+
+from app.models import Prediction, db
+import atexit
+import logging
+import orjson
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# Records that still fail after every retry are appended here as JSON lines
+DEAD_LETTER_FILE = os.getenv('PREDICTION_DEAD_LETTER_FILE', 'failed_predictions.jsonl')
+
+class PredictionWriter:
+    """
+    Buffers prediction records in-process and writes them with one
+    bulk_insert_mappings + commit per batch (every `batch_size` records or
+    `flush_interval` seconds, whichever comes first).
+
+    The database assigns each record's integer id on insert, so endpoints
+    respond without one; a record becomes visible in history once its batch
+    is flushed (at most `flush_interval` seconds later).
+
+    A failed batch insert is retried `max_retries` times with exponential
+    backoff, then each record is inserted on its own so one bad row cannot
+    drop the rest; records that still fail go to `dead_letter_file`.
+    """
+
+    def __init__(self, batch_size=64, flush_interval=0.5, max_retries=3,
+                 retry_delay=0.5, dead_letter_file=DEAD_LETTER_FILE):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.dead_letter_file = dead_letter_file
+        self._queue = queue.Queue()
+        self._app = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, app, record):
+        """Queue a record (a Prediction column -> value dict) for writing"""
+        if self._thread is None:
+            # Started on first use so no thread exists in a pre-fork master
+            with self._lock:
+                if self._thread is None:
+                    self._app = app
+                    self._thread = threading.Thread(
+                        target=self._run, name='prediction-writer', daemon=True
+                    )
+                    self._thread.start()
+                    atexit.register(self.close)
+        self._queue.put(record)
+
+    def close(self):
+        """Flush buffered records and stop the writer thread"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                record = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                record = None
+
+            if record is _STOP:
+                self._flush(batch)
+                return
+            if record is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(record)
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch):
+        """Write one batch in a single multi-row INSERT, retrying before falling back per record"""
+        if not batch:
+            return
+        with self._app.app_context():
+            for attempt in range(self.max_retries + 1):
+                if self._insert(batch):
+                    logger.info(f"Saved {len(batch)} prediction records")
+                    return
+                if attempt < self.max_retries:
+                    time.sleep(self.retry_delay * 2 ** attempt)
+
+            failed = [record for record in batch if not self._insert([record])]
+            if failed:
+                self._dead_letter(failed)
+            logger.warning(f"Saved {len(batch) - len(failed)} of {len(batch)} prediction records row by row")
+
+    def _insert(self, records):
+        """Bulk-insert records in one transaction; False (rolled back) on failure"""
+        try:
+            db.session.bulk_insert_mappings(Prediction, records)
+            db.session.commit()
+            return True
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to save {len(records)} prediction records: {str(e)}")
+            return False
+
+    def _dead_letter(self, records):
+        """Append unsaved records to the dead-letter file for later replay"""
+        try:
+            with open(self.dead_letter_file, 'ab') as f:
+                for record in records:
+                    f.write(orjson.dumps(record) + b'\n')
+            logger.error(f"Wrote {len(records)} unsaved prediction records to {self.dead_letter_file}")
+        except OSError as e:
+            logger.error(f"Lost {len(records)} prediction records, dead-letter write failed: {str(e)}")
@@ -0,0 +1,57 @@
+"""
+Request schemas for the prediction endpoints
+
+Validation runs in pydantic-core (compiled), so a request is coerced and
+type-checked in a single call. Field names match the training feature
+lists saved in ml_models/<disease>/features.pkl.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+STRICT_CONFIG = ConfigDict(extra='forbid', strict=True)
+
+class HeartInput(BaseModel):
+    """Heart disease (Cleveland) patient record"""
+    model_config = STRICT_CONFIG
+    
+    age: int
+    sex: int
+    cp: int
+    trestbps: float
+    chol: float
+    fbs: int
+    restecg: int
+    thalach: float
+    exang: int
+    oldpeak: float
+    slope: int
+    ca: int
+    thal: int
+
+class DiabetesInput(BaseModel):
+    """Diabetes (Pima Indians) patient record"""
+    model_config = STRICT_CONFIG
+    
+    Pregnancies: int
+    Glucose: float
+    BloodPressure: float
+    SkinThickness: float
+    Insulin: float
+    BMI: float
+    DiabetesPedigreeFunction: float
+    Age: int
+
+# Wisconsin breast cancer: 10 cell-nucleus measurements x (mean, se, worst).
+# Some names contain spaces ("concave points_mean"), so they are aliases.
+CANCER_MEASUREMENTS = [
+    'radius', 'texture', 'perimeter', 'area', 'smoothness', 'compactness',
+    'concavity', 'concave points', 'symmetry', 'fractal_dimension'
+]
+CANCER_FEATURES = [f"{m}_{stat}" for stat in ('mean', 'se', 'worst') for m in CANCER_MEASUREMENTS]
+
+CancerInput = create_model(
+    'CancerInput',
+    __config__=STRICT_CONFIG,
+    __doc__="Breast cancer (Wisconsin) tumor measurements",
+    **{name.replace(' ', '_'): (float, Field(alias=name)) for name in CANCER_FEATURES}
+)
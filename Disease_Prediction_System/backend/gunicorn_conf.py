@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for the Disease Prediction API
+
+Usage:
+    gunicorn -c gunicorn_conf.py "app:create_app()"
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Sync-style threaded workers: sklearn/ONNX Runtime release the GIL inside
+# their C kernels, so threads overlap inference. gevent is avoided because
+# joblib/sklearn may hold C-level locks that would stall the event loop.
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+timeout = 30
+
+# Import the app once in the master; workers inherit it via fork (copy-on-write)
+preload_app = True
+
+def when_ready(server):
+    """Load all models and explainers in the master so forked workers share the read-only pages"""
+    from app.api.predictions import explanation_service, ml_service
+    ml_service.load_models()
+    explanation_service.load_explainers()
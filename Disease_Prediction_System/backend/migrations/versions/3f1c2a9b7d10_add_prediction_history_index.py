@@ -0,0 +1,32 @@
+"""Add composite index for prediction history queries
+
+Covers GET /api/predict/history: filter by user_id (and optionally
+disease_type), ORDER BY created_at DESC, reading probability/result.
+
+Revision ID: 3f1c2a9b7d10
+Revises:
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_prediction_user_created',
+        'prediction',
+        ['user_id', sa.text('created_at DESC'), 'disease_type'],
+        postgresql_include=['probability', 'result']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_prediction_user_created', table_name='prediction')
@@ -70,6 +70,11 @@ class ProjectConfig:
     random_state: int = 42
     cv_folds: int = 5
     
+    # EDA settings
+    deep_memory: bool = True  # False: report memory from dtype sizes only (no per-object scan)
+    eda_dtype: str = "float32"  # Numeric dtype for EDA statistics; "float64" for full precision
+    plot_workers: int = 4  # Processes rendering dashboard plots; 1 renders in-process
+    
     # Paths
     raw_data_path: Path = None
     processed_data_path: Path = None
@@ -0,0 +1,96 @@
+"""
+Numba kernels for hot EDA column scans.
+
+Each kernel has a plain NumPy fallback with the same signature, so callers
+work unchanged when Numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+def _iqr_outliers_numpy(arr, lower, upper, out_samples):
+    """Count values outside [lower, upper] and copy the first few into out_samples"""
+    mask = (arr < lower) | (arr > upper)
+    samples = arr[mask][:len(out_samples)]
+    out_samples[:len(samples)] = samples
+    return int(mask.sum()), len(samples)
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def iqr_outliers(arr, lower, upper, out_samples):
+        """Fused single pass: count outliers and collect the first len(out_samples)"""
+        count = 0
+        n_collected = 0
+        cap = out_samples.shape[0]
+        for i in range(arr.shape[0]):
+            value = arr[i]
+            if value < lower or value > upper:
+                if n_collected < cap:
+                    out_samples[n_collected] = value
+                    n_collected += 1
+                count += 1
+        return count, n_collected
+else:
+    iqr_outliers = _iqr_outliers_numpy
+
+def _box_stats_numpy(values, valid, whis=1.5):
+    """Per-column (q1, median, q3, whisker low, whisker high) like matplotlib's boxplot"""
+    out = np.full((values.shape[1], 5), np.nan)
+    for j in range(values.shape[1]):
+        col = values[valid[:, j], j]
+        if len(col) == 0:
+            continue
+        q1, med, q3 = np.percentile(col, [25, 50, 75])
+        iqr = q3 - q1
+        inside = col[(col >= q1 - whis * iqr) & (col <= q3 + whis * iqr)]
+        out[j] = (q1, med, q3, inside.min(), inside.max())
+    return out
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _sorted_quantile(col, q):
+        """Linear-interpolated quantile of an already sorted array (np.percentile default)"""
+        pos = q * (col.shape[0] - 1)
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, col.shape[0] - 1)
+        return col[lo] + (col[hi] - col[lo]) * (pos - lo)
+    
+    @njit(cache=True, parallel=True, nogil=True)
+    def box_stats(values, valid, whis=1.5):
+        """Boxplot statistics for every column, one column per thread"""
+        n_cols = values.shape[1]
+        out = np.full((n_cols, 5), np.nan)
+        for j in prange(n_cols):
+            col = np.sort(values[:, j][valid[:, j]])
+            n = col.shape[0]
+            if n == 0:
+                continue
+            q1 = _sorted_quantile(col, 0.25)
+            med = _sorted_quantile(col, 0.5)
+            q3 = _sorted_quantile(col, 0.75)
+            iqr = q3 - q1
+            
+            # Whiskers reach the most extreme values inside the fences
+            lo = 0
+            while col[lo] < q1 - whis * iqr:
+                lo += 1
+            hi = n - 1
+            while col[hi] > q3 + whis * iqr:
+                hi -= 1
+            
+            out[j, 0] = q1
+            out[j, 1] = med
+            out[j, 2] = q3
+            out[j, 3] = col[lo]
+            out[j, 4] = col[hi]
+        return out
+else:
+    box_stats = _box_stats_numpy
+
+def warm_up():
+    """Trigger JIT compilation (or load it from the on-disk cache)"""
+    iqr_outliers(np.zeros(1), -1.0, 1.0, np.empty(1))
@@ -4,16 +4,18 @@ Advanced Exploratory Data Analysis with statistical testing and insights.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Iterator, NamedTuple, Optional, Tuple
+from itertools import islice
 from dataclasses import dataclass, field
 import logging
 from scipy import stats
-from scipy.stats import chi2_contingency, f_oneway, kruskal
-import statsmodels.api as sm
-from statsmodels.formula.api import ols
+from scipy.stats import chi2_contingency
+from joblib import Parallel, delayed
 import warnings
 
 from ..config.settings import ProjectConfig
+from ._numba_kernels import warm_up
+from .outlier_detector import detect_outliers_iqr_array
 from ..utils.decorators import timer, log_execution
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,20 @@ class FeatureInsight:
     distribution: str
     recommendations: List[str]
 
+class ColumnData(NamedTuple):
+    """Per-column arrays shared by every analysis phase"""
+    values: np.ndarray
+    valid: np.ndarray
+    n_valid: int
+    n_missing: int
+    missing_pct: float
+
+class NumericData(NamedTuple):
+    """All numeric columns as one Fortran-ordered float block (config.eda_dtype)"""
+    names: pd.Index
+    values: np.ndarray
+    valid: np.ndarray
+
 class EDAnalyzer:
     """
     Professional EDA analyzer with statistical tests and automated insights.
@@ -47,6 +63,7 @@ class EDAnalyzer:
     def __init__(self, config: ProjectConfig):
         self.config = config
         self.insights = []
+        warm_up()
         
     @timer
     @log_execution
@@ -62,21 +79,76 @@ class EDAnalyzer:
         """
         logger.info("Starting comprehensive EDA analysis")
         
+        numeric = self._numeric_cache(df)
+        columns = self._prepare(df, numeric)
+        univariate = self._analyze_univariate(df, columns, numeric.names)
+        
         results = {
-            'overview': self._analyze_overview(df),
-            'univariate': self._analyze_univariate(df),
-            'bivariate': self._analyze_bivariate(df),
-            'multivariate': self._analyze_multivariate(df),
-            'statistical_tests': self._run_statistical_tests(df),
-            'insights': self._generate_insights(df),
-            'recommendations': self._generate_recommendations(df)
+            'overview': self._analyze_overview(df, columns),
+            'univariate': univariate,
+            'bivariate': self._analyze_bivariate(df, numeric),
+            'multivariate': self._analyze_multivariate(df, numeric),
+            'statistical_tests': self._run_statistical_tests(df, numeric, univariate),
+            'insights': list(self._generate_insights(df, columns, numeric.names)),
+            'recommendations': list(islice(  # Top 10
+                self._generate_recommendations(df, univariate), 10
+            ))
         }
         
         logger.info(f"EDA completed: {len(results['insights'])} insights generated")
         return results
     
-    def _analyze_overview(self, df: pd.DataFrame) -> Dict:
+    def _numeric_cache(self, df: pd.DataFrame) -> NumericData:
+        """
+        Materialize the numeric columns once for every NumPy/SciPy kernel
+        
+        Fortran order keeps each column stride-1, so axis=0 reductions and
+        per-column views read contiguous memory. float32 (the default
+        eda_dtype) halves the bytes every memory-bound reduction streams.
+        """
+        names = df.select_dtypes(include=[np.number]).columns
+        # na_value maps pd.NA in nullable Int64/Float64 columns to NaN for the valid mask
+        values = np.asfortranarray(
+            df[names].to_numpy(dtype=np.dtype(self.config.eda_dtype), na_value=np.nan)
+        )
+        return NumericData(names, values, ~np.isnan(values))
+    
+    def _prepare(self, df: pd.DataFrame, numeric: NumericData) -> Dict[str, ColumnData]:
+        """Scan the frame for nulls once and cache per-column arrays"""
+        position = {col: k for k, col in enumerate(numeric.names)}
+        nulls = df[df.columns.difference(numeric.names, sort=False)].isna()
+        
+        columns = {}
+        for col in df.columns:
+            if col in position:
+                # Contiguous views into the shared numeric block
+                k = position[col]
+                values, valid = numeric.values[:, k], numeric.valid[:, k]
+            else:
+                values, valid = df[col].to_numpy(), ~nulls[col].to_numpy()
+            n_valid = int(valid.sum())
+            n_missing = len(df) - n_valid
+            columns[col] = ColumnData(
+                values,
+                valid,
+                n_valid,
+                n_missing,
+                (n_missing / len(df)) * 100
+            )
+        
+        return columns
+    
+    def _analyze_overview(self, df: pd.DataFrame, columns: Dict[str, ColumnData]) -> Dict:
         """Basic dataset overview"""
+        # deep=True sizes every Python object in object columns, so scan once
+        memory_mb = df.memory_usage(deep=self.config.deep_memory) / 1024**2
+        
+        # Complete rows from the cached null masks instead of df.dropna() copies
+        complete = np.ones(len(df), dtype=bool)
+        for data in columns.values():
+            complete &= data.valid
+        complete_rows = int(complete.sum())
+        
         return {
             'shape': {
                 'rows': df.shape[0],
@@ -84,113 +156,154 @@ class EDAnalyzer:
             },
             'data_types': df.dtypes.astype(str).to_dict(),
             'memory_usage': {
-                'total_mb': df.memory_usage(deep=True).sum() / 1024**2,
-                'per_column': (df.memory_usage(deep=True) / 1024**2).to_dict()
+                'total_mb': memory_mb.sum(),
+                'per_column': memory_mb.to_dict()
             },
             'completeness': {
-                'complete_rows': len(df.dropna()),
-                'complete_percentage': (len(df.dropna()) / len(df)) * 100,
-                'columns_with_missing': df.columns[df.isnull().any()].tolist()
+                'complete_rows': complete_rows,
+                'complete_percentage': (complete_rows / len(df)) * 100,
+                'columns_with_missing': [col for col, data in columns.items() if data.n_missing > 0]
             }
         }
     
-    def _analyze_univariate(self, df: pd.DataFrame) -> Dict:
+    def _analyze_univariate(self, df: pd.DataFrame, columns: Dict[str, ColumnData],
+                            numeric_cols: pd.Index) -> Dict:
         """Univariate analysis for each feature"""
         results = {}
+        numeric_set = set(numeric_cols)
+        
+        # One vectorized reduction per statistic across all numeric columns,
+        # instead of ~11 separate pandas calls per column
+        if len(numeric_cols) > 0:
+            numeric_frame = df[numeric_cols]
+            summary = numeric_frame.describe(percentiles=[.25, .5, .75]).T
+            modes = numeric_frame.mode()
+            skewness = numeric_frame.skew()
+            kurtosis = numeric_frame.kurtosis()
         
         for col in df.columns:
-            col_data = df[col].dropna()
+            values, valid, n_valid, n_missing, missing_pct = columns[col]
+            col_data = values[valid]
             
-            if pd.api.types.is_numeric_dtype(df[col]):
+            if col in numeric_set:
                 # Numerical feature analysis
+                col_stats = summary.loc[col]
+                q1, q3 = col_stats['25%'], col_stats['75%']
+                mode = modes[col].iloc[0] if not modes.empty else np.nan
                 results[col] = {
                     'type': 'numerical',
-                    'count': len(col_data),
-                    'missing': df[col].isnull().sum(),
-                    'missing_pct': (df[col].isnull().sum() / len(df)) * 100,
+                    'count': n_valid,
+                    'missing': n_missing,
+                    'missing_pct': missing_pct,
                     'statistics': {
-                        'mean': float(col_data.mean()),
-                        'median': float(col_data.median()),
-                        'mode': float(col_data.mode()[0]) if not col_data.mode().empty else None,
-                        'std': float(col_data.std()),
-                        'var': float(col_data.var()),
-                        'min': float(col_data.min()),
-                        'max': float(col_data.max()),
-                        'range': float(col_data.max() - col_data.min()),
-                        'q1': float(col_data.quantile(0.25)),
-                        'q3': float(col_data.quantile(0.75)),
-                        'iqr': float(col_data.quantile(0.75) - col_data.quantile(0.25))
+                        'mean': float(col_stats['mean']),
+                        'median': float(col_stats['50%']),
+                        'mode': float(mode) if pd.notna(mode) else None,
+                        'std': float(col_stats['std']),
+                        'var': float(col_stats['std'] ** 2),
+                        'min': float(col_stats['min']),
+                        'max': float(col_stats['max']),
+                        'range': float(col_stats['max'] - col_stats['min']),
+                        'q1': float(q1),
+                        'q3': float(q3),
+                        'iqr': float(q3 - q1)
                     },
                     'shape': {
-                        'skewness': float(col_data.skew()),
-                        'kurtosis': float(col_data.kurtosis()),
-                        'is_normal': self._test_normality(col_data)
+                        'skewness': float(skewness[col]),
+                        'kurtosis': float(kurtosis[col]),
+                        'is_normal': self._test_normality(n_valid, skewness[col], kurtosis[col])
                     },
-                    'outliers': self._detect_outliers_iqr(col_data)
+                    'outliers': detect_outliers_iqr_array(col_data, q1, q3)
                 }
             else:
-                # Categorical feature analysis
-                value_counts = col_data.value_counts()
+                # Categorical feature analysis: one hash pass feeds every statistic
+                value_counts = pd.Series(col_data).value_counts()
+                frequencies = value_counts / n_valid
                 results[col] = {
                     'type': 'categorical',
-                    'count': len(col_data),
-                    'missing': df[col].isnull().sum(),
-                    'missing_pct': (df[col].isnull().sum() / len(df)) * 100,
-                    'unique_values': col_data.nunique(),
+                    'count': n_valid,
+                    'missing': n_missing,
+                    'missing_pct': missing_pct,
+                    'unique_values': len(value_counts),
                     'top_values': value_counts.head(10).to_dict(),
-                    'value_frequencies': (value_counts / len(col_data) * 100).head(10).to_dict(),
-                    'entropy': self._calculate_entropy(col_data)
+                    'value_frequencies': (frequencies * 100).head(10).to_dict(),
+                    'entropy': self._calculate_entropy(frequencies)
                 }
         
         return results
     
-    def _analyze_bivariate(self, df: pd.DataFrame) -> Dict:
+    def _analyze_bivariate(self, df: pd.DataFrame, numeric: NumericData) -> Dict:
         """Bivariate analysis with target variable"""
         if 'target' not in df.columns:
             return {}
         
         results = {}
         target = df['target']
+        is_target0 = (target == 0).to_numpy()
+        is_target1 = (target == 1).to_numpy()
+        target_codes, target_labels = pd.factorize(target, sort=True)
+        
+        # Numerical vs Target statistics for all numeric features in one batch
+        features = numeric.names != 'target'
+        position = {col: k for k, col in enumerate(numeric.names[features])}
+        if position:
+            values = numeric.values if features.all() else numeric.values[:, features]
+            group0, group1 = values[is_target0], values[is_target1]
+            
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                mean0, mean1 = np.nanmean(group0, axis=0), np.nanmean(group1, axis=0)
+                median0, median1 = np.nanmedian(group0, axis=0), np.nanmedian(group1, axis=0)
+                std0, std1 = np.nanstd(group0, axis=0, ddof=1), np.nanstd(group1, axis=0, ddof=1)
+                t_stats, t_pvals = stats.ttest_ind(group0, group1, axis=0, nan_policy='omit')
+            t_stats, t_pvals = np.asarray(t_stats), np.asarray(t_pvals)
+            u_stats, u_pvals = self._batched_mannwhitney(group0, group1)
+            
+            # Effect size (Cohen's d)
+            pooled_std = np.sqrt((std0**2 + std1**2) / 2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cohens_ds = np.where(pooled_std > 0, np.abs(mean0 - mean1) / pooled_std, 0)
+        
+        # Categorical vs Target tests are independent per column; run them on a
+        # thread pool (the NumPy/SciPy work inside releases the GIL)
+        categorical_cols = [col for col in df.columns if col != 'target' and col not in position]
+        n_jobs = -1 if len(categorical_cols) > 1 else 1
+        categorical = dict(zip(categorical_cols, Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(self._categorical_vs_target)(df[col], target_codes, target_labels)
+            for col in categorical_cols
+        )))
         
         for col in df.columns:
             if col == 'target':
                 continue
                 
-            if pd.api.types.is_numeric_dtype(df[col]):
-                # Numerical vs Target analysis
-                group0 = df[df['target'] == 0][col].dropna()
-                group1 = df[df['target'] == 1][col].dropna()
-                
-                # Statistical tests
-                t_stat, t_pval = stats.ttest_ind(group0, group1)
-                u_stat, u_pval = stats.mannwhitneyu(group0, group1, alternative='two-sided')
-                
-                # Effect size (Cohen's d)
-                pooled_std = np.sqrt((group0.std()**2 + group1.std()**2) / 2)
-                cohens_d = abs(group0.mean() - group1.mean()) / pooled_std if pooled_std > 0 else 0
+            if col in position:
+                k = position[col]
+                t_pval, u_pval = t_pvals[k], u_pvals[k]
+                cohens_d = cohens_ds[k]
                 
                 results[col] = {
                     'type': 'numerical_vs_target',
                     'group_stats': {
                         'target_0': {
-                            'mean': float(group0.mean()),
-                            'median': float(group0.median()),
-                            'std': float(group0.std())
+                            'mean': float(mean0[k]),
+                            'median': float(median0[k]),
+                            'std': float(std0[k])
                         },
                         'target_1': {
-                            'mean': float(group1.mean()),
-                            'median': float(group1.median()),
-                            'std': float(group1.std())
+                            'mean': float(mean1[k]),
+                            'median': float(median1[k]),
+                            'std': float(std1[k])
                         }
                     },
                     'statistical_tests': {
                         't_test': {
-                            'statistic': float(t_stat),
+                            'statistic': float(t_stats[k]),
                             'p_value': float(t_pval),
                             'significant': t_pval < 0.05
                         },
                         'mann_whitney': {
-                            'statistic': float(u_stat),
+                            'statistic': float(u_stats[k]),
                             'p_value': float(u_pval),
                             'significant': u_pval < 0.05
                         }
@@ -201,57 +314,129 @@ class EDAnalyzer:
                     }
                 }
             else:
-                # Categorical vs Target analysis
-                contingency = pd.crosstab(df[col], df['target'])
-                
-                # Chi-square test
-                chi2, pval, dof, expected = chi2_contingency(contingency)
-                
-                # Cramer's V for effect size
-                n = len(df)
-                min_dim = min(contingency.shape) - 1
-                cramers_v = np.sqrt(chi2 / (n * min_dim)) if min_dim > 0 else 0
-                
-                results[col] = {
-                    'type': 'categorical_vs_target',
-                    'contingency_table': contingency.to_dict(),
-                    'statistical_tests': {
-                        'chi_square': {
-                            'statistic': float(chi2),
-                            'p_value': float(pval),
-                            'dof': int(dof),
-                            'significant': pval < 0.05
-                        }
-                    },
-                    'effect_size': {
-                        'cramers_v': float(cramers_v),
-                        'interpretation': self._interpret_cramers_v(cramers_v)
-                    }
-                }
+                results[col] = categorical[col]
         
         return results
     
-    def _analyze_multivariate(self, df: pd.DataFrame) -> Dict:
+    def _categorical_vs_target(self, data: pd.Series, target_codes: np.ndarray,
+                               target_labels: pd.Index) -> Dict:
+        """Chi-square association between one categorical column and the target"""
+        contingency, categories, labels = self._contingency_table(data, target_codes, target_labels)
+        
+        # Chi-square test
+        chi2, pval, dof, expected = chi2_contingency(contingency)
+        
+        # Cramer's V for effect size
+        n = len(data)
+        min_dim = min(contingency.shape) - 1
+        cramers_v = np.sqrt(chi2 / (n * min_dim)) if min_dim > 0 else 0
+        
+        return {
+            'type': 'categorical_vs_target',
+            'contingency_table': {
+                label: dict(zip(categories, contingency[:, j].tolist()))
+                for j, label in enumerate(labels)
+            },
+            'statistical_tests': {
+                'chi_square': {
+                    'statistic': float(chi2),
+                    'p_value': float(pval),
+                    'dof': int(dof),
+                    'significant': pval < 0.05
+                }
+            },
+            'effect_size': {
+                'cramers_v': float(cramers_v),
+                'interpretation': self._interpret_cramers_v(cramers_v)
+            }
+        }
+    
+    def _contingency_table(self, data: pd.Series, target_codes: np.ndarray,
+                           target_labels: pd.Index) -> Tuple[np.ndarray, List, List]:
+        """
+        Category x target counts in one O(N) pass (same table as pd.crosstab)
+        
+        Returns:
+            Tuple of (counts, category labels, target labels)
+        """
+        codes, categories = pd.factorize(data, sort=True)
+        n_targets = len(target_labels)
+        
+        # Rows with a missing category or target are dropped, as crosstab does
+        keep = (codes >= 0) & (target_codes >= 0)
+        counts = np.bincount(codes[keep] * n_targets + target_codes[keep],
+                             minlength=len(categories) * n_targets)
+        counts = counts.reshape(len(categories), n_targets)
+        
+        # Drop categories / target values that only occurred alongside missing values
+        rows = counts.any(axis=1)
+        cols = counts.any(axis=0)
+        return counts[rows][:, cols], categories[rows].tolist(), target_labels[cols].tolist()
+    
+    def _batched_mannwhitney(self, group0: np.ndarray, group1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Two-sided Mann-Whitney U test for every column at once
+        
+        Equivalent to stats.mannwhitneyu(method='asymptotic', nan_policy='omit')
+        per column: one batched ranking, then the tie-corrected normal
+        approximation with continuity correction.
+        
+        Returns:
+            Tuple of (U statistic of group0, p-value) arrays
+        """
+        combined = np.vstack([group0, group1])
+        valid = ~np.isnan(combined)
+        valid0 = valid[:len(group0)]
+        n0 = valid0.sum(axis=0)
+        n1 = valid[len(group0):].sum(axis=0)
+        n = n0 + n1
+        
+        # NaNs rank last, so valid values get the same ranks as with NaNs dropped
+        ranks = stats.rankdata(np.where(valid, combined, np.inf), axis=0)
+        u0 = np.where(valid0, ranks[:len(group0)], 0).sum(axis=0) - n0 * (n0 + 1) / 2
+        
+        # Tie group sizes from runs of equal values down each sorted column
+        # (NaNs sort last and never compare equal, so they add nothing)
+        ordered = np.sort(combined, axis=0)
+        run_starts = np.ones(ordered.shape, dtype=bool)
+        run_starts[1:] = ordered[1:] != ordered[:-1]
+        starts = np.flatnonzero(run_starts.T)
+        sizes = np.diff(np.append(starts, run_starts.size)).astype(np.float64)
+        tie_term = np.bincount(starts // len(combined), weights=sizes**3 - sizes,
+                               minlength=combined.shape[1])
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma = np.sqrt(n0 * n1 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+            u = np.maximum(u0, n0 * n1 - u0)
+            z = (u - n0 * n1 / 2 - 0.5) / sigma
+        p_values = np.clip(2 * stats.norm.sf(z), 0, 1)
+        
+        return u0, p_values
+    
+    def _analyze_multivariate(self, df: pd.DataFrame, numeric: NumericData) -> Dict:
         """Multivariate analysis"""
         results = {}
         
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = numeric.names
         
         if len(numeric_cols) > 1:
             # Correlation analysis
             corr_matrix = df[numeric_cols].corr()
             
-            # Find highly correlated pairs
-            high_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        high_corr.append({
-                            'feature1': corr_matrix.columns[i],
-                            'feature2': corr_matrix.columns[j],
-                            'correlation': float(corr_val)
-                        })
+            # Find highly correlated pairs in the upper triangle
+            matrix = corr_matrix.to_numpy()
+            names = corr_matrix.columns.to_numpy()
+            rows, cols = np.triu_indices(len(names), k=1)
+            corr_vals = matrix[rows, cols]
+            selected = np.abs(corr_vals) > 0.7
+            high_corr = [
+                {
+                    'feature1': names[i],
+                    'feature2': names[j],
+                    'correlation': float(corr_val)
+                }
+                for i, j, corr_val in zip(rows[selected], cols[selected], corr_vals[selected])
+            ]
             
             results['correlations'] = {
                 'matrix': corr_matrix.to_dict(),
@@ -261,45 +446,58 @@ class EDAnalyzer:
             # PCA analysis for dimensionality insight
             if len(numeric_cols) > 2:
                 from sklearn.decomposition import PCA
-                from sklearn.preprocessing import StandardScaler
                 
-                scaler = StandardScaler()
-                scaled_data = scaler.fit_transform(df[numeric_cols].fillna(df[numeric_cols].mean()))
+                # Mean-impute and standardize in NumPy (zero-variance columns keep scale 1,
+                # as StandardScaler does)
+                values = numeric.values
+                filled = np.where(numeric.valid, values, np.nanmean(values, axis=0))
+                std = filled.std(axis=0)
+                std[std == 0] = 1.0
+                scaled_data = (filled - filled.mean(axis=0)) / std
                 
-                pca = PCA()
+                # Randomized SVD of the leading components instead of a full LAPACK SVD
+                n_components = min(scaled_data.shape[0], scaled_data.shape[1], 50)
+                pca = PCA(n_components=n_components, svd_solver='randomized', random_state=0)
                 pca.fit(scaled_data)
                 
+                cumulative = np.cumsum(pca.explained_variance_ratio_)
+                reached = cumulative >= 0.95
                 results['pca'] = {
                     'explained_variance_ratio': pca.explained_variance_ratio_.tolist(),
-                    'cumulative_variance': np.cumsum(pca.explained_variance_ratio_).tolist(),
-                    'components_needed_95': np.argmax(np.cumsum(pca.explained_variance_ratio_) >= 0.95) + 1
+                    'cumulative_variance': cumulative.tolist(),
+                    # None when more than the computed components are needed
+                    'components_needed_95': int(np.argmax(reached)) + 1 if reached.any() else None
                 }
         
         return results
     
-    def _run_statistical_tests(self, df: pd.DataFrame) -> Dict:
+    def _run_statistical_tests(self, df: pd.DataFrame, numeric: NumericData,
+                               univariate_results: Dict) -> Dict:
         """Run comprehensive statistical tests"""
         results = {}
         
-        # Test for normality on numeric columns
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        # Normality on numeric columns: the univariate pass already ran the
+        # same D'Agostino K^2 test from its skewness/kurtosis
+        numeric_cols = numeric.names
         normality_tests = {}
         
         for col in numeric_cols:
-            col_data = df[col].dropna()
-            if len(col_data) >= 8:
-                stat, pval = stats.normaltest(col_data)
-                normality_tests[col] = {
-                    'statistic': float(stat),
-                    'p_value': float(pval),
-                    'is_normal': pval > 0.05
-                }
+            normality = univariate_results[col]['shape']['is_normal']
+            if normality['is_normal'] is None or np.isnan(normality['statistic']):
+                continue
+            normality_tests[col] = {
+                'statistic': normality['statistic'],
+                'p_value': normality['p_value'],
+                'is_normal': normality['is_normal']
+            }
         
         results['normality'] = normality_tests
         
-        # Test for homoscedasticity
+        # Test for homoscedasticity (on the last numeric column)
         if 'target' in df.columns and len(numeric_cols) > 1:
-            groups = [df[df['target'] == i][col].dropna() for i in df['target'].unique()]
+            values, valid = numeric.values[:, -1], numeric.valid[:, -1]
+            target = df['target'].to_numpy()
+            groups = [values[valid & (target == i)] for i in df['target'].unique()]
             if all(len(g) > 0 for g in groups):
                 stat, pval = stats.levene(*groups)
                 results['homoscedasticity'] = {
@@ -311,93 +509,70 @@ class EDAnalyzer:
         
         return results
     
-    def _generate_insights(self, df: pd.DataFrame) -> List[str]:
+    def _generate_insights(self, df: pd.DataFrame, columns: Dict[str, ColumnData],
+                           numeric_cols: pd.Index) -> Iterator[str]:
         """Generate natural language insights"""
-        insights = []
-        
         # Dataset size insight
-        insights.append(f"Dataset contains {df.shape[0]:,} patients with {df.shape[1]} features")
+        yield f"Dataset contains {df.shape[0]:,} patients with {df.shape[1]} features"
         
         # Missing data insight
-        missing_total = df.isnull().sum().sum()
+        missing_total = sum(data.n_missing for data in columns.values())
         if missing_total > 0:
-            insights.append(f"Found {missing_total} missing values across the dataset")
+            yield f"Found {missing_total} missing values across the dataset"
         
         # Class balance insight
         if 'target' in df.columns:
             target_dist = df['target'].value_counts(normalize=True)
             minority_pct = target_dist.min() * 100
             if minority_pct < 30:
-                insights.append(f"⚠️ Imbalanced dataset: minority class is only {minority_pct:.1f}%")
+                yield f"⚠️ Imbalanced dataset: minority class is only {minority_pct:.1f}%"
         
         # Feature insights
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
         for col in numeric_cols[:5]:  # Limit to top 5
-            col_data = df[col].dropna()
-            skew = col_data.skew()
+            data = columns[col]
+            skew = stats.skew(data.values[data.valid], bias=False)
             if abs(skew) > 1:
-                insights.append(f"📊 {col} is highly skewed ({skew:.2f}) - consider transformation")
-        
-        return insights
+                yield f"📊 {col} is highly skewed ({skew:.2f}) - consider transformation"
     
-    def _generate_recommendations(self, df: pd.DataFrame) -> List[str]:
-        """Generate actionable recommendations"""
-        recommendations = []
+    def _generate_recommendations(self, df: pd.DataFrame, univariate_results: Dict) -> Iterator[str]:
+        """
+        Generate actionable recommendations
+        
+        Reads missing, outlier and spread figures from the univariate results
+        instead of rescanning columns; lazy, so the caller can stop early.
+        """
+        numerical = {col: res for col, res in univariate_results.items() if res['type'] == 'numerical'}
         
         # Missing value recommendations
-        missing_pct = df.isnull().sum() / len(df) * 100
-        high_missing = missing_pct[missing_pct > 5]
-        if not high_missing.empty:
-            for col, pct in high_missing.items():
-                recommendations.append(f"Handle missing values in {col} ({pct:.1f}% missing)")
+        for col, res in univariate_results.items():
+            if res['missing_pct'] > 5:
+                yield f"Handle missing values in {col} ({res['missing_pct']:.1f}% missing)"
         
         # Outlier recommendations
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            outliers = self._detect_outliers_iqr(df[col].dropna())
+        for col, res in numerical.items():
+            outliers = res['outliers']
             if outliers['count'] > 0:
                 pct = outliers['percentage']
                 if pct > 5:
-                    recommendations.append(f"Consider capping outliers in {col} ({pct:.1f}% outliers)")
+                    yield f"Consider capping outliers in {col} ({pct:.1f}% outliers)"
         
         # Scaling recommendations
-        for col in numeric_cols:
-            col_data = df[col].dropna()
-            if col_data.std() > 100:  # Large scale difference
-                recommendations.append(f"Scale {col} due to large magnitude differences")
+        for col, res in numerical.items():
+            if res['statistics']['std'] > 100:  # Large scale difference
+                yield f"Scale {col} due to large magnitude differences"
         
         # Class imbalance recommendation
         if 'target' in df.columns:
             target_dist = df['target'].value_counts(normalize=True)
             if target_dist.min() < 0.3:
-                recommendations.append("Apply SMOTE or class weights to handle imbalance")
-        
-        return recommendations[:10]  # Return top 10
-    
-    def _detect_outliers_iqr(self, data: pd.Series) -> Dict:
-        """Detect outliers using IQR method"""
-        Q1 = data.quantile(0.25)
-        Q3 = data.quantile(0.75)
-        IQR = Q3 - Q1
-        lower = Q1 - 1.5 * IQR
-        upper = Q3 + 1.5 * IQR
-        
-        outliers = data[(data < lower) | (data > upper)]
-        
-        return {
-            'count': len(outliers),
-            'percentage': (len(outliers) / len(data)) * 100,
-            'lower_bound': float(lower),
-            'upper_bound': float(upper),
-            'outlier_values': outliers.tolist()[:10]  # First 10 outliers
-        }
+                yield "Apply SMOTE or class weights to handle imbalance"
     
-    def _test_normality(self, data: pd.Series) -> Dict:
-        """Test if data follows normal distribution"""
-        if len(data) < 8:
+    def _test_normality(self, n: int, skewness: float, kurtosis: float) -> Dict:
+        """Test if data follows normal distribution (from its precomputed moments)"""
+        if n < 8:
             return {'is_normal': None, 'reason': 'Insufficient data'}
         
-        stat, pval = stats.normaltest(data)
+        stat, pval = self._normaltest_from_moments(n, skewness, kurtosis)
         
         return {
             'is_normal': pval > 0.05,
@@ -405,10 +580,55 @@ class EDAnalyzer:
             'statistic': float(stat)
         }
     
-    def _calculate_entropy(self, data: pd.Series) -> float:
-        """Calculate entropy for categorical data"""
-        value_counts = data.value_counts(normalize=True)
-        return float(-sum(value_counts * np.log2(value_counts)))
+    def _normaltest_from_moments(self, n, skewness, kurtosis) -> Tuple[float, float]:
+        """
+        D'Agostino-Pearson K^2 test (stats.normaltest) without rescanning the data
+        
+        Args:
+            n: Sample size (>= 8)
+            skewness: Bias-corrected sample skewness (pandas Series.skew)
+            kurtosis: Bias-corrected excess kurtosis (pandas Series.kurtosis)
+            
+        Returns:
+            Tuple of (K^2 statistic, p-value)
+        """
+        n = float(n)
+        
+        # Back to the biased moments normaltest uses
+        g1 = skewness * (n - 2) / np.sqrt(n * (n - 1))
+        b2 = (kurtosis * (n - 2) * (n - 3) / (n - 1) - 6) / (n + 1) + 3
+        
+        # Skewness z-score (stats.skewtest)
+        y = g1 * np.sqrt((n + 1) * (n + 3) / (6.0 * (n - 2)))
+        beta2 = (3.0 * (n**2 + 27 * n - 70) * (n + 1) * (n + 3)
+                 / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9)))
+        w2 = -1 + np.sqrt(2 * (beta2 - 1))
+        delta = 1 / np.sqrt(0.5 * np.log(w2))
+        alpha = np.sqrt(2.0 / (w2 - 1))
+        y = np.where(y == 0, 1, y)
+        z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha)**2 + 1))
+        
+        # Kurtosis z-score (stats.kurtosistest)
+        expected = 3.0 * (n - 1) / (n + 1)
+        var_b2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+        x = (b2 - expected) / np.sqrt(var_b2)
+        sqrt_beta1 = (6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9))
+                      * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3))))
+        a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + np.sqrt(1 + 4.0 / sqrt_beta1**2))
+        term1 = 1 - 2 / (9.0 * a)
+        denom = 1 + x * np.sqrt(2 / (a - 4.0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            term2 = np.sign(denom) * np.where(denom == 0.0, np.nan, ((1 - 2.0 / a) / np.abs(denom))**(1 / 3.0))
+        z_kurt = (term1 - term2) / np.sqrt(2 / (9.0 * a))
+        
+        stat = z_skew**2 + z_kurt**2
+        return float(stat), float(stats.chi2.sf(stat, 2))
+    
+    def _calculate_entropy(self, frequencies: pd.Series) -> float:
+        """Calculate entropy from a categorical column's normalized value counts"""
+        freq = frequencies.to_numpy(dtype=np.float64)
+        freq = freq[freq > 0]
+        return float(-(freq * np.log2(freq)).sum())
     
     def _interpret_cohens_d(self, d: float) -> str:
         """Interpret Cohen's d effect size"""
@@ -5,6 +5,41 @@ Outlier detection utilities.
 import numpy as np
 import pandas as pd
 
+from ._numba_kernels import iqr_outliers
+
+def detect_outliers_iqr_array(arr, q1=None, q3=None, factor=1.5, sample_cap=10):
+    """
+    Detect outliers in a NaN-free numeric array using the IQR method
+    
+    Args:
+        arr: 1-D numeric array without missing values
+        q1: Precomputed first quartile (computed if None)
+        q3: Precomputed third quartile (computed if None)
+        factor: IQR multiplier
+        sample_cap: Number of outlier values to return
+    
+    Returns:
+        dict: Outlier count, percentage, bounds and the first outlier values
+    """
+    arr = np.ascontiguousarray(arr)
+    if q1 is None or q3 is None:
+        # Both quartiles from one shared partial sort
+        q1, q3 = np.quantile(arr, [0.25, 0.75]) if len(arr) else (np.nan, np.nan)
+    iqr = q3 - q1
+    lower = q1 - factor * iqr
+    upper = q3 + factor * iqr
+    
+    samples = np.empty(sample_cap)
+    count, n_samples = iqr_outliers(arr, float(lower), float(upper), samples)
+    
+    return {
+        'count': int(count),
+        'percentage': (count / len(arr)) * 100 if len(arr) > 0 else 0,
+        'lower_bound': float(lower),
+        'upper_bound': float(upper),
+        'outlier_values': samples[:n_samples].tolist()
+    }
+
 def detect_outliers_iqr(df, columns=None, factor=1.5):
     """
     Detect outliers using IQR method
@@ -24,22 +59,16 @@ def detect_outliers_iqr(df, columns=None, factor=1.5):
     
     for col in columns:
         if col in df.columns:
-            data = df[col].dropna()
-            Q1 = data.quantile(0.25)
-            Q3 = data.quantile(0.75)
-            IQR = Q3 - Q1
-            lower = Q1 - factor * IQR
-            upper = Q3 + factor * IQR
-            
-            outliers = data[(data < lower) | (data > upper)]
+            data = df[col].dropna().to_numpy()
+            outliers = detect_outliers_iqr_array(data, factor=factor, sample_cap=0)
             
             results[col] = {
-                'count': len(outliers),
-                'percentage': (len(outliers) / len(data)) * 100 if len(data) > 0 else 0,
-                'lower_bound': lower,
-                'upper_bound': upper,
-                'min': data.min(),
-                'max': data.max()
+                'count': outliers['count'],
+                'percentage': outliers['percentage'],
+                'lower_bound': outliers['lower_bound'],
+                'upper_bound': outliers['upper_bound'],
+                'min': data.min() if len(data) > 0 else np.nan,
+                'max': data.max() if len(data) > 0 else np.nan
             }
     
-    return results
\ No newline at end of file
+    return results
@@ -2,32 +2,223 @@
 Professional visualization module with publication-quality plots.
 """
 
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
 import pandas as pd
 import numpy as np
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 import logging
+import multiprocessing as mp
+import os
+import tempfile
 from datetime import datetime
+from functools import cached_property
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import warnings
+from scipy.stats import gaussian_kde
 
 from ..config.settings import ProjectConfig
+from ._numba_kernels import box_stats
 
 logger = logging.getLogger(__name__)
 
+# Object columns with at most this many levels are plotted as pandas categoricals
+MAX_CATEGORY_LEVELS = 50
+
+def _corr_with_target(df: pd.DataFrame, numeric_cols: pd.Index, target_col: str = 'target') -> pd.Series:
+    """
+    Pearson correlation of each column with the target, using pairwise-complete
+    rows like DataFrame.corrwith, as a few matrix-vector products instead of
+    a full F x F correlation matrix
+    """
+    X = df[numeric_cols].to_numpy(dtype=np.float64)
+    y = df[target_col].to_numpy(dtype=np.float64)
+    
+    # Centering doesn't change r but keeps the sums below well conditioned
+    X = X - np.nanmean(X, axis=0)
+    y = y - np.nanmean(y)
+    mask = ~np.isnan(X) & ~np.isnan(y)[:, None]
+    X = np.where(mask, X, 0.0)
+    y = np.nan_to_num(y)
+    m = mask.astype(np.float64)
+    
+    n = m.sum(axis=0)
+    sum_x, sum_xx = X.sum(axis=0), (X * X).sum(axis=0)
+    sum_y, sum_yy = m.T @ y, m.T @ (y * y)
+    sum_xy = X.T @ y
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = (n * sum_xy - sum_x * sum_y) / np.sqrt(
+            (n * sum_xx - sum_x**2) * (n * sum_yy - sum_y**2)
+        )
+    return pd.Series(r, index=numeric_cols)
+
+def _fill_kde(ax, values: np.ndarray, grid: np.ndarray, **kwargs) -> None:
+    """Shade a Gaussian KDE of values over a precomputed grid"""
+    # A KDE needs at least two distinct values, as with seaborn's kdeplot
+    if len(values) < 2 or np.ptp(values) == 0:
+        return
+    ax.fill_between(grid, gaussian_kde(values)(grid), **kwargs)
+
+def _new_figure(**kwargs) -> Figure:
+    """Figure on its own Agg canvas, outside pyplot's global figure manager"""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+class DashboardData:
+    """
+    Frame-level derivations shared by the dashboard plots.
+    Each one is computed on first use and then reused by every plot.
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+    
+    @cached_property
+    def numeric_cols(self) -> pd.Index:
+        return self.df.select_dtypes(include=[np.number]).columns
+    
+    @cached_property
+    def feature_cols(self) -> pd.Index:
+        """Numeric columns other than the target"""
+        return self.numeric_cols.drop('target', errors='ignore')
+    
+    @cached_property
+    def categorical_cols(self) -> pd.Index:
+        return self.df.select_dtypes(include=['object', 'category']).columns
+    
+    @cached_property
+    def categorical_frame(self) -> pd.DataFrame:
+        """
+        Categorical columns with low-cardinality object columns converted to
+        category dtype, so crosstabs and value counts work on integer codes
+        (the caller's frame is left untouched)
+        """
+        frame = self.df[self.categorical_cols].copy()
+        for col in frame.columns:
+            if frame[col].dtype == object and frame[col].nunique() <= MAX_CATEGORY_LEVELS:
+                frame[col] = frame[col].astype('category')
+        return frame
+    
+    @cached_property
+    def missing(self) -> pd.Series:
+        return self.df.isnull().sum()
+    
+    @cached_property
+    def missing_nonzero(self) -> pd.Series:
+        """Missing counts of columns with any missing value, largest first"""
+        return self.missing[self.missing > 0].sort_values(ascending=False)
+    
+    @cached_property
+    def missing_pct(self) -> pd.Series:
+        """Missing percentage of the columns in missing_nonzero"""
+        return (self.missing_nonzero / len(self.df)) * 100
+    
+    @cached_property
+    def corr(self) -> pd.DataFrame:
+        """Correlation matrix; one float32 corrcoef pass when no values are missing"""
+        X = self.df[self.numeric_cols].to_numpy(dtype=np.float32)
+        if np.isnan(X).any():
+            # Missing values need pandas' pairwise-complete correlation
+            return self.df[self.numeric_cols].corr()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            C = np.corrcoef(X, rowvar=False)
+        return pd.DataFrame(C, index=self.numeric_cols, columns=self.numeric_cols)
+    
+    @cached_property
+    def target_corr(self) -> pd.Series:
+        """Correlation of each feature with the target"""
+        return _corr_with_target(self.df, self.feature_cols)
+    
+    @cached_property
+    def kde_grids(self) -> Dict[str, np.ndarray]:
+        """One 200-point evaluation grid per feature, shared by every KDE of it"""
+        values = self.df[self.feature_cols].to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+            lo, hi = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+        return {col: np.linspace(lo[j], hi[j], 200) for j, col in enumerate(self.feature_cols)}
+    
+    @cached_property
+    def groups(self) -> Dict[int, pd.DataFrame]:
+        """Rows of each target class from a single groupby pass"""
+        grouped = dict(tuple(self.df.groupby('target', sort=False)))
+        return {value: grouped.get(value, self.df.iloc[:0]) for value in [0, 1]}
+    
+    @cached_property
+    def box_stats(self) -> List[List[Dict]]:
+        """
+        Precomputed Axes.bxp() stats: one list per feature, one dict per box
+        (No Disease / Disease, or All without a target)
+        """
+        if 'target' in self.df.columns:
+            frames = [('No Disease', self.groups[0]), ('Disease', self.groups[1])]
+        else:
+            frames = [('All', self.df)]
+        
+        per_feature = [[] for _ in self.feature_cols]
+        for label, frame in frames:
+            values = np.asfortranarray(frame[self.feature_cols].to_numpy(dtype=np.float64))
+            valid = ~np.isnan(values)
+            summary = box_stats(values, valid)
+            for j, (q1, med, q3, whislo, whishi) in enumerate(summary):
+                col = values[valid[:, j], j]
+                per_feature[j].append({
+                    'label': label, 'q1': q1, 'med': med, 'q3': q3,
+                    'whislo': whislo, 'whishi': whishi,
+                    'fliers': col[(col < whislo) | (col > whishi)]
+                })
+        return per_feature
+
+# Per-process state of a dashboard rendering worker
+_worker_visualizer = None
+_worker_df = None
+
+def _init_render_worker(config: ProjectConfig, df_path: str) -> None:
+    """Load the pickled frame once per worker and build its visualizer"""
+    global _worker_visualizer, _worker_df
+    matplotlib.use('Agg')
+    _worker_df = pd.read_pickle(df_path)
+    _worker_visualizer = EDAVisualizer(config)
+    _worker_visualizer._cache = DashboardData(_worker_df)
+
+def _render_plot(method_name: str) -> None:
+    """Render one dashboard plot in a worker process"""
+    getattr(_worker_visualizer, method_name)(_worker_df)
+
 class EDAVisualizer:
     """
     Professional visualization class for comprehensive EDA plots.
     Produces publication-quality visualizations with multiple formats.
     """
     
+    # Figures are laid out explicitly, so skip the extra render pass of a tight bbox
+    SAVE_KW = dict(dpi=150, bbox_inches=None, pil_kwargs={'optimize': True})
+    
+    # Independent plots of the dashboard; each writes its own PNG
+    DASHBOARD_PLOTS = (
+        'plot_target_distribution',
+        'plot_numeric_distributions',
+        'plot_categorical_distributions',
+        'plot_correlation_heatmap',
+        'plot_missing_values',
+        'plot_outliers',
+        'plot_pairplot',
+        'plot_feature_importance',
+        'create_summary_dashboard'
+    )
+    
     def __init__(self, config: ProjectConfig):
         self.config = config
         self.output_dir = config.get_report_path('eda')
+        self._cache = None
         self.setup_style()
         
     def setup_style(self):
@@ -69,27 +260,45 @@ class EDAVisualizer:
         """
         logger.info("Creating comprehensive visualization dashboard")
         
-        # Create individual plots
-        self.plot_target_distribution(df)
-        self.plot_numeric_distributions(df)
-        self.plot_categorical_distributions(df)
-        self.plot_correlation_heatmap(df)
-        self.plot_missing_values(df)
-        self.plot_outliers(df)
-        self.plot_pairplot(df)
-        self.plot_feature_importance(df)
-        
-        # Create combined dashboard
-        self.create_summary_dashboard(df)
+        n_workers = min(self.config.plot_workers, len(self.DASHBOARD_PLOTS), os.cpu_count() or 1)
+        if n_workers > 1:
+            self._render_parallel(df, n_workers)
+        else:
+            # Every plot below shares one set of derived column lists, splits and stats
+            self._cache = DashboardData(df)
+            try:
+                for method_name in self.DASHBOARD_PLOTS:
+                    getattr(self, method_name)(df)
+            finally:
+                self._cache = None
         
         logger.info(f"All plots saved to {self.output_dir}")
     
+    def _render_parallel(self, df: pd.DataFrame, n_workers: int) -> None:
+        """Render the dashboard plots across spawned Agg worker processes"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Written once and loaded once per worker rather than pickled per task
+            df_path = os.path.join(tmp_dir, 'frame.pkl')
+            df.to_pickle(df_path)
+            
+            ctx = mp.get_context('spawn')
+            with ctx.Pool(n_workers, initializer=_init_render_worker,
+                          initargs=(self.config, df_path)) as pool:
+                pool.map(_render_plot, self.DASHBOARD_PLOTS)
+    
+    def _data(self, df: pd.DataFrame) -> DashboardData:
+        """Shared derivations for df (fresh when a plot is called on its own)"""
+        if self._cache is not None and self._cache.df is df:
+            return self._cache
+        return DashboardData(df)
+    
     def plot_target_distribution(self, df: pd.DataFrame) -> None:
         """Plot target variable distribution"""
         if 'target' not in df.columns:
             return
             
-        fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+        fig = _new_figure(figsize=(12, 5))
+        axes = fig.subplots(1, 2)
         
         # Count plot
         ax = axes[0]
@@ -100,10 +309,7 @@ class EDAVisualizer:
         ax.set_ylabel('Count')
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}', ha='center', va='bottom')
+        ax.bar_label(bars, labels=[f'{int(v)}' for v in target_counts.values], padding=3)
         
         # Pie chart
         ax = axes[1]
@@ -114,16 +320,13 @@ class EDAVisualizer:
                                           startangle=90)
         ax.set_title('Target Distribution (%)', fontweight='bold', pad=20)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'target_distribution.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'target_distribution.png', **self.SAVE_KW)
     
     def plot_numeric_distributions(self, df: pd.DataFrame) -> None:
         """Plot distributions of numeric features"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if 'target' in numeric_cols:
-            numeric_cols = numeric_cols.drop('target')
+        data = self._data(df)
+        numeric_cols = data.feature_cols
         
         if len(numeric_cols) == 0:
             return
@@ -131,7 +334,8 @@ class EDAVisualizer:
         n_cols = len(numeric_cols)
         n_rows = (n_cols + 3) // 4  # 4 plots per row
         
-        fig, axes = plt.subplots(n_rows, 4, figsize=(20, n_rows * 4))
+        fig = _new_figure(figsize=(20, n_rows * 4))
+        axes = fig.subplots(n_rows, 4)
         axes = axes.flatten()
         
         for i, col in enumerate(numeric_cols):
@@ -139,11 +343,10 @@ class EDAVisualizer:
             
             if 'target' in df.columns:
                 # Plot by target class
-                for target in [0, 1]:
-                    subset = df[df['target'] == target][col].dropna()
-                    if len(subset) > 0:
-                        sns.kdeplot(subset, label=f'Target {target}', ax=ax, 
-                                   fill=True, alpha=0.5)
+                for target, color in ((0, 'success'), (1, 'danger')):
+                    subset = data.groups[target][col].dropna().values
+                    _fill_kde(ax, subset, data.kde_grids[col], label=f'Target {target}',
+                              color=self.colors[color], alpha=0.5)
                 ax.legend(['No Disease', 'Disease'])
             else:
                 # Simple histogram
@@ -164,15 +367,14 @@ class EDAVisualizer:
         for j in range(i + 1, len(axes)):
             axes[j].set_visible(False)
         
-        plt.suptitle('Numeric Feature Distributions', fontsize=16, fontweight='bold', y=1.02)
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'numeric_distributions.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.suptitle('Numeric Feature Distributions', fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'numeric_distributions.png', **self.SAVE_KW)
     
     def plot_categorical_distributions(self, df: pd.DataFrame) -> None:
         """Plot distributions of categorical features"""
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        data = self._data(df)
+        categorical_cols = data.categorical_cols
         
         if len(categorical_cols) == 0:
             return
@@ -180,23 +382,25 @@ class EDAVisualizer:
         n_cols = len(categorical_cols)
         n_rows = (n_cols + 3) // 4
         
-        fig, axes = plt.subplots(n_rows, 4, figsize=(20, n_rows * 4))
+        fig = _new_figure(figsize=(20, n_rows * 4))
+        axes = fig.subplots(n_rows, 4)
         axes = axes.flatten()
         
         for i, col in enumerate(categorical_cols):
             ax = axes[i]
+            values = data.categorical_frame[col]
             
             # Get value counts
             if 'target' in df.columns:
                 # Stacked bar chart by target
-                crosstab = pd.crosstab(df[col], df['target'], normalize='index') * 100
+                crosstab = pd.crosstab(values, df['target'], normalize='index') * 100
                 crosstab.plot(kind='bar', stacked=True, ax=ax,
                             color=[self.colors['success'], self.colors['danger']])
                 ax.set_ylabel('Percentage')
                 ax.legend(['No Disease', 'Disease'], loc='upper right')
             else:
                 # Simple bar chart
-                value_counts = df[col].value_counts().head(10)
+                value_counts = values.value_counts().head(10)
                 value_counts.plot(kind='bar', ax=ax, color=self.colors['primary'])
                 ax.set_ylabel('Count')
             
@@ -208,22 +412,21 @@ class EDAVisualizer:
         for j in range(i + 1, len(axes)):
             axes[j].set_visible(False)
         
-        plt.suptitle('Categorical Feature Distributions', fontsize=16, fontweight='bold', y=1.02)
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'categorical_distributions.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.suptitle('Categorical Feature Distributions', fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'categorical_distributions.png', **self.SAVE_KW)
     
     def plot_correlation_heatmap(self, df: pd.DataFrame) -> None:
         """Plot correlation heatmap for numeric features"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        data = self._data(df)
         
-        if len(numeric_cols) < 2:
+        if len(data.numeric_cols) < 2:
             return
         
-        corr = df[numeric_cols].corr()
+        corr = data.corr
         
-        fig, ax = plt.subplots(figsize=(14, 12))
+        fig = _new_figure(figsize=(14, 12))
+        ax = fig.subplots()
         
         # Create mask for upper triangle
         mask = np.triu(np.ones_like(corr, dtype=bool))
@@ -235,20 +438,18 @@ class EDAVisualizer:
         
         ax.set_title('Feature Correlation Matrix', fontsize=16, fontweight='bold', pad=20)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'correlation_heatmap.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'correlation_heatmap.png', **self.SAVE_KW)
     
     def plot_missing_values(self, df: pd.DataFrame) -> None:
         """Plot missing value analysis"""
-        missing = df.isnull().sum()
-        missing = missing[missing > 0].sort_values(ascending=False)
+        missing = self._data(df).missing_nonzero
         
         if len(missing) == 0:
             return
         
-        fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+        fig = _new_figure(figsize=(15, 6))
+        axes = fig.subplots(1, 2)
         
         # Bar plot
         ax = axes[0]
@@ -259,10 +460,7 @@ class EDAVisualizer:
         ax.set_ylabel('Missing Count')
         
         # Add value labels
-        for bar, val in zip(bars, missing.values):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{val}', ha='center', va='bottom')
+        ax.bar_label(bars, labels=[str(v) for v in missing.values], padding=3)
         
         # Pie chart of missing vs complete
         ax = axes[1]
@@ -277,16 +475,13 @@ class EDAVisualizer:
                                           startangle=90)
         ax.set_title('Overall Missing Data', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'missing_values.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'missing_values.png', **self.SAVE_KW)
     
     def plot_outliers(self, df: pd.DataFrame) -> None:
         """Plot outlier analysis using boxplots"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if 'target' in numeric_cols:
-            numeric_cols = numeric_cols.drop('target')
+        data = self._data(df)
+        numeric_cols = data.feature_cols
         
         if len(numeric_cols) == 0:
             return
@@ -294,17 +489,15 @@ class EDAVisualizer:
         n_cols = len(numeric_cols)
         n_rows = (n_cols + 3) // 4
         
-        fig, axes = plt.subplots(n_rows, 4, figsize=(20, n_rows * 5))
+        fig = _new_figure(figsize=(20, n_rows * 5))
+        axes = fig.subplots(n_rows, 4)
         axes = axes.flatten()
         
         for i, col in enumerate(numeric_cols):
             ax = axes[i]
             
-            data_to_plot = [df[df['target'] == 0][col].dropna() if 'target' in df.columns else df[col].dropna(),
-                           df[df['target'] == 1][col].dropna() if 'target' in df.columns else []]
-            
-            bp = ax.boxplot(data_to_plot, patch_artist=True,
-                           labels=['No Disease', 'Disease'] if 'target' in df.columns else ['All'])
+            # Quartiles and whiskers come from the jitted kernel; bxp only draws
+            bp = ax.bxp(data.box_stats[i], patch_artist=True)
             
             # Color boxes
             if 'target' in df.columns:
@@ -319,26 +512,21 @@ class EDAVisualizer:
         for j in range(i + 1, len(axes)):
             axes[j].set_visible(False)
         
-        plt.suptitle('Outlier Analysis - Boxplots', fontsize=16, fontweight='bold', y=1.02)
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'outliers.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.suptitle('Outlier Analysis - Boxplots', fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'outliers.png', **self.SAVE_KW)
     
     def plot_pairplot(self, df: pd.DataFrame) -> None:
         """Create pairplot for selected features"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        data = self._data(df)
+        numeric_cols = data.numeric_cols
         
         if len(numeric_cols) > 10:  # Limit to top 10 features
             # Select top features based on correlation with target
             if 'target' in numeric_cols:
-                correlations = df[numeric_cols].corr()['target'].abs().sort_values(ascending=False)
-                top_features = correlations.head(6).index.tolist()  # Include target
-                if 'target' in top_features:
-                    top_features.remove('target')
-                top_features = top_features[:5]  # Top 5 features
-                if 'target' not in top_features:
-                    top_features.append('target')
+                correlations = data.target_corr.abs().sort_values(ascending=False)
+                top_features = correlations.head(5).index.tolist()  # Top 5 features
+                top_features.append('target')
             else:
                 top_features = numeric_cols[:6]
         else:
@@ -347,33 +535,53 @@ class EDAVisualizer:
         if len(top_features) < 2:
             return
         
-        # Create pairplot
-        g = sns.pairplot(df[top_features], hue='target' if 'target' in top_features else None,
-                        palette=[self.colors['success'], self.colors['danger']],
-                        diag_kind='kde', plot_kws={'alpha': 0.6})
-        
-        g.fig.suptitle('Feature Pairplot Analysis', y=1.02, fontsize=16, fontweight='bold')
-        
-        plt.savefig(self.output_dir / 'pairplot.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        # Hexbin grid: off-diagonal cost is bounded by the bin grid, not the row count
+        has_target = 'target' in top_features
+        features = [c for c in top_features if c != 'target']
+        if has_target:
+            layers = [(data.groups[0], 'Greens', self.colors['success']),
+                      (data.groups[1], 'Reds', self.colors['danger'])]
+        else:
+            layers = [(df, 'Blues', self.colors['primary'])]
+        
+        k = len(features)
+        fig = _new_figure(figsize=(2.5 * k, 2.5 * k))
+        axes = fig.subplots(k, k, squeeze=False)
+        
+        for i, row_col in enumerate(features):
+            for j, col in enumerate(features):
+                ax = axes[i, j]
+                for frame, cmap, color in layers:
+                    if i == j:
+                        values = frame[col].dropna().values
+                        _fill_kde(ax, values, data.kde_grids[col], color=color, alpha=0.5)
+                    else:
+                        pair = frame[[col, row_col]].dropna()
+                        ax.hexbin(pair[col], pair[row_col], gridsize=40, cmap=cmap,
+                                  mincnt=1, alpha=0.6 if has_target else 1.0)
+                ax.set_xlabel(col if i == k - 1 else '')
+                ax.set_ylabel(row_col if j == 0 and i != j else '')
+        
+        fig.suptitle('Feature Pairplot Analysis', fontsize=16, fontweight='bold')
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'pairplot.png', **self.SAVE_KW)
     
     def plot_feature_importance(self, df: pd.DataFrame) -> None:
         """Plot feature importance using correlation with target"""
         if 'target' not in df.columns:
             return
         
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if 'target' in numeric_cols:
-            numeric_cols = numeric_cols.drop('target')
+        data = self._data(df)
+        numeric_cols = data.feature_cols
         
         if len(numeric_cols) == 0:
             return
         
         # Calculate correlation with target
-        correlations = abs(df[numeric_cols].corrwith(df['target'])).sort_values(ascending=True)
+        correlations = abs(data.target_corr).sort_values(ascending=True)
         
-        fig, ax = plt.subplots(figsize=(10, max(6, len(numeric_cols) * 0.3)))
+        fig = _new_figure(figsize=(10, max(6, len(numeric_cols) * 0.3)))
+        ax = fig.subplots()
         
         # Horizontal bar plot
         colors = [self.colors['primary'] if c < 0.3 else 
@@ -387,21 +595,18 @@ class EDAVisualizer:
         ax.set_title('Feature Importance (Correlation with Target)', fontweight='bold')
         
         # Add value labels
-        for i, (bar, val) in enumerate(zip(bars, correlations.values)):
-            width = bar.get_width()
-            ax.text(width + 0.01, i, f'{val:.3f}', va='center')
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'feature_importance.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        ax.bar_label(bars, labels=[f'{v:.3f}' for v in correlations.values], padding=3)
+        
+        fig.tight_layout()
+        fig.savefig(self.output_dir / 'feature_importance.png', **self.SAVE_KW)
     
     def create_summary_dashboard(self, df: pd.DataFrame) -> None:
         """Create summary dashboard with key plots"""
-        fig = plt.figure(figsize=(20, 15))
+        data = self._data(df)
+        fig = _new_figure(figsize=(20, 15))
         
         # Create grid
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3, top=0.92)
         
         # 1. Target distribution
         ax1 = fig.add_subplot(gs[0, 0])
@@ -413,9 +618,7 @@ class EDAVisualizer:
         
         # 2. Missing values
         ax2 = fig.add_subplot(gs[0, 1])
-        missing = df.isnull().sum()
-        missing_pct = (missing / len(df)) * 100
-        missing_pct = missing_pct[missing_pct > 0].sort_values(ascending=False)
+        missing_pct = data.missing_pct
         if len(missing_pct) > 0:
             ax2.bar(range(len(missing_pct)), missing_pct.values, color=self.colors['danger'])
             ax2.set_xticks(range(len(missing_pct)))
@@ -426,9 +629,8 @@ class EDAVisualizer:
         # 3. Feature correlations
         ax3 = fig.add_subplot(gs[0, 2])
         if 'target' in df.columns:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            if len(numeric_cols) > 1:
-                corr = df[numeric_cols].corr()['target'].drop('target').sort_values(ascending=False).head(10)
+            if len(data.numeric_cols) > 1 and 'target' in data.numeric_cols:
+                corr = data.target_corr.sort_values(ascending=False).head(10)
                 ax3.barh(range(len(corr)), corr.values, color=self.colors['primary'])
                 ax3.set_yticks(range(len(corr)))
                 ax3.set_yticklabels(corr.index)
@@ -436,18 +638,15 @@ class EDAVisualizer:
                 ax3.set_xlabel('Correlation')
         
         # 4-6. Top 3 numeric features
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if 'target' in numeric_cols:
-            numeric_cols = numeric_cols.drop('target')
+        numeric_cols = data.feature_cols
         
         for i, col in enumerate(numeric_cols[:3]):
             ax = fig.add_subplot(gs[1, i])
             if 'target' in df.columns:
-                for target in [0, 1]:
-                    subset = df[df['target'] == target][col].dropna()
-                    if len(subset) > 0:
-                        sns.kdeplot(subset, ax=ax, label=f'Target {target}', 
-                                   fill=True, alpha=0.5)
+                for target, color in ((0, 'success'), (1, 'danger')):
+                    subset = data.groups[target][col].dropna().values
+                    _fill_kde(ax, subset, data.kde_grids[col], label=f'Target {target}',
+                              color=self.colors[color], alpha=0.5)
                 ax.legend(['No Disease', 'Disease'], fontsize=8)
             else:
                 ax.hist(df[col].dropna(), bins=30, alpha=0.7, color=self.colors['primary'])
@@ -457,19 +656,14 @@ class EDAVisualizer:
         # 7-9. Boxplots
         for i, col in enumerate(numeric_cols[3:6]):
             ax = fig.add_subplot(gs[2, i])
+            bp = ax.bxp(data.box_stats[i + 3])
             if 'target' in df.columns:
-                data_to_plot = [df[df['target'] == 0][col].dropna(),
-                               df[df['target'] == 1][col].dropna()]
-                bp = ax.boxplot(data_to_plot, labels=['No', 'Yes'])
+                ax.set_xticklabels(['No', 'Yes'])
                 bp['boxes'][0].set_color(self.colors['success'])
                 bp['boxes'][1].set_color(self.colors['danger'])
-            else:
-                ax.boxplot(df[col].dropna())
             ax.set_title(f'{col}', fontweight='bold')
         
-        plt.suptitle(f'{self.config.model.name.upper()} - EDA Summary Dashboard', 
-                    fontsize=20, fontweight='bold', y=1.02)
+        fig.suptitle(f'{self.config.model.name.upper()} - EDA Summary Dashboard', 
+                    fontsize=20, fontweight='bold')
         
-        plt.savefig(self.output_dir / 'summary_dashboard.png', 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
\ No newline at end of file
+        fig.savefig(self.output_dir / 'summary_dashboard.png', **self.SAVE_KW)
\ No newline at end of file
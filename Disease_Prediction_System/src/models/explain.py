@@ -6,21 +6,48 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger('model_explainer')
 
-def explain_with_shap(model, X_test, feature_names, model_type='tree'):
-    """Generate SHAP explanations for model predictions"""
+def explain_with_shap(model, X_test, feature_names, model_type='tree', max_samples=1000):
+    """Generate SHAP explanations for model predictions (at most max_samples rows)"""
     
     logger.info("Generating SHAP explanations...")
     
-    if model_type == 'tree':
-        explainer = shap.TreeExplainer(model)
+    X_test = np.ascontiguousarray(X_test[:max_samples], dtype=np.float32)
+    
+    background = X_test[:100]
+    
+    if hasattr(model, 'coef_'):
+        # Closed-form attributions for linear models
+        explainer = shap.LinearExplainer(model, background)
+    elif model_type == 'tree':
+        if type(model).__name__ == 'XGBClassifier':
+            from src.models.train import xgb_tree_method
+            if xgb_tree_method() == 'gpu_hist':
+                # XGBoost computes the contributions itself; run them on the GPU.
+                # Set on a copy so the caller's fitted model keeps its predictor
+                booster = model.get_booster().copy()
+                booster.set_param({'predictor': 'gpu_predictor'})
+                model = booster
+        explainer = shap.TreeExplainer(model, feature_perturbation='tree_path_dependent')
     else:
-        explainer = shap.KernelExplainer(model.predict_proba, X_test[:100])
+        # Unified API picks a batched permutation backend for a black-box callable
+        explainer = shap.Explainer(model.predict_proba, shap.maskers.Independent(background))
     
-    shap_values = explainer.shap_values(X_test[:100])
+    if isinstance(explainer, shap.TreeExplainer):
+        # Saabas-style approximation: O(T·L) per row instead of O(T·L·D²)
+        shap_values = explainer.shap_values(X_test, approximate=True, check_additivity=False)
+        expected_value = explainer.expected_value
+    elif isinstance(explainer, shap.LinearExplainer):
+        shap_values = explainer.shap_values(X_test)
+        expected_value = explainer.expected_value
+    else:
+        # Keep the positive-class output, shaped like the tree/linear results
+        explanation = explainer(X_test)
+        shap_values = explanation.values[..., -1]
+        expected_value = explanation.base_values[0, -1]
     
     # Summary plot
     plt.figure(figsize=(12, 8))
-    shap.summary_plot(shap_values, X_test[:100], 
+    shap.summary_plot(shap_values, X_test, 
                      feature_names=feature_names,
                      show=False)
     plt.title('SHAP Feature Impact', fontsize=16, fontweight='bold')
@@ -29,7 +56,7 @@ def explain_with_shap(model, X_test, feature_names, model_type='tree'):
     plt.close()
     
     # Individual prediction explanation
-    shap.force_plot(explainer.expected_value, 
+    shap.force_plot(expected_value, 
                    shap_values[0] if isinstance(shap_values, list) else shap_values[0,:],
                    X_test[0,:],
                    feature_names=feature_names,
@@ -0,0 +1,220 @@
+"""
+Export trained models to serving formats used by the backend MLService.
+"""
+
+import argparse
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.ensemble import (ExtraTreesClassifier, GradientBoostingClassifier,
+                              RandomForestClassifier)
+from sklearn.pipeline import make_pipeline
+from src.utils.logger import setup_logger
+
+logger = setup_logger('model_exporter')
+
+TREE_ENSEMBLES = (RandomForestClassifier, ExtraTreesClassifier, GradientBoostingClassifier)
+
+# Graph tensor names read by the backend MLService
+ONNX_INPUT = 'input'
+ONNX_LABEL_OUTPUT = 'label'
+ONNX_PROBA_OUTPUT = 'output_probability'
+
+def export_onnx(model, scaler, n_features, output_path):
+    """
+    Bundle a fitted scaler + classifier into one ONNX graph
+
+    Args:
+        model: Fitted sklearn classifier
+        scaler: Fitted StandardScaler applied before the classifier
+        n_features: Number of input features
+        output_path: Destination .onnx file
+
+    Returns:
+        Path: Written model path
+    """
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import (FloatTensorType, Int64TensorType,
+                                            StringTensorType)
+
+    pipeline = make_pipeline(scaler, model)
+
+    # Pipelines name their outputs label/probabilities; pin the names the backend reads
+    label_type = (Int64TensorType([None]) if np.issubdtype(model.classes_.dtype, np.integer)
+                  else StringTensorType([None]))
+    final_types = [
+        (ONNX_LABEL_OUTPUT, label_type),
+        (ONNX_PROBA_OUTPUT, FloatTensorType([None, len(model.classes_)]))
+    ]
+
+    # zipmap=False keeps output_probability a plain (n, n_classes) float tensor
+    onnx_model = convert_sklearn(
+        pipeline,
+        initial_types=[(ONNX_INPUT, FloatTensorType([None, n_features]))],
+        final_types=final_types,
+        options={id(model): {'zipmap': False}}
+    )
+
+    output_path = Path(output_path)
+    output_path.write_bytes(onnx_model.SerializeToString())
+    logger.info(f"ONNX model saved to {output_path}")
+    return output_path
+
+def quantize_onnx(model_path, calibration_data, output_path, tolerance=0.02):
+    """
+    Statically quantize an ONNX model to int8 (QDQ, per-channel)
+
+    Only MatMul/Gemm-style nodes are quantized by ONNX Runtime; ai.onnx.ml
+    operators (tree ensembles, SVM, linear classifiers) stay FP32. The
+    quantized graph is discarded if its probabilities drift from the FP32
+    model by more than `tolerance` on the calibration rows.
+
+    Args:
+        model_path: FP32 .onnx model
+        calibration_data: ~100 raw (unscaled) training rows, shape (n, n_features)
+        output_path: Destination .onnx file for the int8 model
+        tolerance: Maximum allowed absolute probability difference
+
+    Returns:
+        Path or None: Written model path, or None if rejected
+    """
+    import onnxruntime as ort
+    from onnxruntime.quantization import (CalibrationDataReader, QuantFormat,
+                                          quantize_static)
+
+    calibration_data = np.asarray(calibration_data, dtype=np.float32)
+
+    class _RowReader(CalibrationDataReader):
+        def __init__(self, rows):
+            self._rows = iter(rows)
+
+        def get_next(self):
+            row = next(self._rows, None)
+            return None if row is None else {ONNX_INPUT: row[np.newaxis, :]}
+
+    def _proba(path):
+        session = ort.InferenceSession(str(path), providers=['CPUExecutionProvider'])
+        return session.run([ONNX_PROBA_OUTPUT], {ONNX_INPUT: calibration_data})[0]
+
+    # The backend prefers model.int8.onnx, so only a verified graph may land there
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        quantize_static(
+            str(model_path), str(tmp_path),
+            calibration_data_reader=_RowReader(calibration_data),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True
+        )
+
+        drift = float(np.max(np.abs(_proba(model_path) - _proba(tmp_path))))
+        if drift > tolerance:
+            logger.warning(f"Rejected int8 model for {model_path}: max probability drift {drift:.4f}")
+            # Don't leave an int8 graph from an earlier export in front of the new FP32 one
+            output_path.unlink(missing_ok=True)
+            return None
+
+        tmp_path.replace(output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info(f"Int8 model saved to {output_path} (max probability drift {drift:.4f})")
+    return output_path
+
+def is_xgboost(model):
+    """Whether the model is an XGBClassifier (no skl2onnx converter)"""
+    return type(model).__name__ == 'XGBClassifier'
+
+def is_tree_ensemble(model):
+    """Whether the model can be compiled with Treelite"""
+    return isinstance(model, TREE_ENSEMBLES) or is_xgboost(model)
+
+def export_treelite(model, output_path, parallel_comp=32):
+    """
+    Compile a tree ensemble to a native shared library with Treelite
+
+    The library scores already-scaled features, so the backend still applies
+    the saved scaler before calling it.
+
+    Args:
+        model: Fitted sklearn tree ensemble or XGBClassifier
+        output_path: Destination shared library (e.g. predictor.so)
+        parallel_comp: Number of translation units to split the trees into
+
+    Returns:
+        Path: Written library path
+    """
+    import treelite
+    import treelite.sklearn
+
+    if is_xgboost(model):
+        tl_model = treelite.Model.from_xgboost(model.get_booster())
+    else:
+        tl_model = treelite.sklearn.import_model(model)
+
+    output_path = Path(output_path)
+    tl_model.export_lib(
+        toolchain='gcc',
+        libpath=str(output_path),
+        params={'parallel_comp': parallel_comp},
+        verbose=False
+    )
+    logger.info(f"Treelite predictor saved to {output_path}")
+    return output_path
+
+def _try_export(fmt, export_fn, output_path, *args):
+    """
+    Run one export independently of the others. On failure the error is
+    logged and any stale artifact from an earlier model is removed, so the
+    backend falls back to the next format instead of serving it.
+
+    Returns:
+        Path or None: Written path, or None if the export failed or was rejected
+    """
+    try:
+        return export_fn(*args, output_path)
+    except Exception as e:
+        logger.error(f"{fmt} export failed for {output_path.parent.name}: {e}")
+        output_path.unlink(missing_ok=True)
+        return None
+
+def export_all(model_dir):
+    """Export every <disease>/model.pkl under the backend ml_models directory"""
+    for disease_path in sorted(Path(model_dir).iterdir()):
+        if not (disease_path / 'model.pkl').exists():
+            continue
+
+        model = joblib.load(disease_path / 'model.pkl')
+        scaler = joblib.load(disease_path / 'scaler.pkl')
+        features = joblib.load(disease_path / 'features.pkl')
+
+        logger.info(f"Exporting {disease_path.name} ({type(model).__name__})...")
+        onnx_path = None
+        if is_xgboost(model):
+            # Served by Treelite, or the pickle when the runtime is missing
+            logger.info("Skipping ONNX: skl2onnx has no XGBClassifier converter")
+            (disease_path / 'model.onnx').unlink(missing_ok=True)
+        else:
+            onnx_path = _try_export('ONNX', export_onnx, disease_path / 'model.onnx',
+                                    model, scaler, len(features))
+
+        if is_tree_ensemble(model):
+            _try_export('Treelite', export_treelite, disease_path / 'predictor.so', model)
+        else:
+            (disease_path / 'predictor.so').unlink(missing_ok=True)
+
+        # calibration.npy: ~100 raw training rows ordered like features.pkl
+        calibration_path = disease_path / 'calibration.npy'
+        if onnx_path is not None and calibration_path.exists():
+            _try_export('Int8 ONNX', quantize_onnx, disease_path / 'model.int8.onnx',
+                        onnx_path, np.load(calibration_path))
+        else:
+            (disease_path / 'model.int8.onnx').unlink(missing_ok=True)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export trained models for serving')
+    parser.add_argument('model_dir', nargs='?', default='backend/app/ml_models',
+                        help='Directory containing <disease>/model.pkl files')
+    args = parser.parse_args()
+    export_all(args.model_dir)
@@ -9,14 +9,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 def timer(func):
-    """Decorator to measure function execution time"""
+    """Decorator to measure function execution time (no clock reads unless DEBUG is enabled)"""
     @functools.wraps(func)
     def wrapper_timer(*args, **kwargs):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
         start_time = time.perf_counter()
         value = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        run_time = end_time - start_time
-        logger.debug(f"{func.__name__} took {run_time:.4f} seconds")
+        run_time = time.perf_counter() - start_time
+        logger.debug("%s took %.4f seconds", func.__name__, run_time)
         return value
     return wrapper_timer
 
@@ -24,12 +25,15 @@ def log_execution(func):
     """Decorator to log function execution"""
     @functools.wraps(func)
     def wrapper_log(*args, **kwargs):
-        logger.debug(f"Starting {func.__name__}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Starting %s", func.__name__)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"Completed {func.__name__}")
-            return result
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {e}")
+            logger.error("Error in %s: %s", func.__name__, e)
             raise
-    return wrapper_log
\ No newline at end of file
+        if debug:
+            logger.debug("Completed %s", func.__name__)
+        return result
+    return wrapper_log
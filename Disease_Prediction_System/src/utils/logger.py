@@ -8,6 +8,14 @@ from datetime import datetime
 import os
 from pathlib import Path
 
+FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# name -> (log_level, log_file) the logger's handlers were last built with
+_configured = {}
+
 def setup_logging(name, log_level=logging.INFO, log_file=None):
     """
     Set up logging with consistent formatting
@@ -20,6 +28,10 @@ def setup_logging(name, log_level=logging.INFO, log_file=None):
     Returns:
         logging.Logger: Configured logger
     """
+    settings = (log_level, str(log_file) if log_file else None)
+    if _configured.get(name) == settings:
+        return logging.getLogger(name)
+    
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
@@ -28,16 +40,10 @@ def setup_logging(name, log_level=logging.INFO, log_file=None):
     if logger.handlers:
         logger.handlers.clear()
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(FORMATTER)
     logger.addHandler(console_handler)
     
     # File handler (if specified)
@@ -48,11 +54,12 @@ def setup_logging(name, log_level=logging.INFO, log_file=None):
             
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(log_level)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(FORMATTER)
             logger.addHandler(file_handler)
         except Exception as e:
             logger.warning(f"Could not create log file: {e}")
     
+    _configured[name] = settings
     return logger
 
 def setup_logger(name):
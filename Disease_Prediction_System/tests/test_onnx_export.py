@@ -0,0 +1,41 @@
+import joblib
+import numpy as np
+import pytest
+import sys
+sys.path.append('.')
+sys.path.append('backend')
+
+pytest.importorskip('skl2onnx')
+pytest.importorskip('onnxruntime')
+
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from src.models.export import export_onnx
+from app.services import ml_service
+
+class TestOnnxExport:
+    def test_exported_model_serves_through_ml_service(self, tmp_path, monkeypatch):
+        """A scaler + SVC exported by export.py scores through MLService's ONNX session"""
+        X, y = make_classification(n_samples=80, n_features=5, random_state=0)
+        scaler = StandardScaler().fit(X)
+        model = SVC(probability=True, random_state=0).fit(scaler.transform(X), y)
+        features = [f'f{i}' for i in range(X.shape[1])]
+
+        disease_path = tmp_path / 'cancer'
+        disease_path.mkdir()
+        joblib.dump(model, disease_path / 'model.pkl')
+        joblib.dump(scaler, disease_path / 'scaler.pkl')
+        joblib.dump(features, disease_path / 'features.pkl')
+        export_onnx(model, scaler, len(features), disease_path / 'model.onnx')
+
+        monkeypatch.setattr(ml_service, 'MODEL_PATH', tmp_path)
+        service = ml_service.MLService()
+        service._ensure_loaded('cancer')
+        assert 'cancer' in service.sessions
+
+        x = X[:10].astype(np.float32)
+        proba = service._infer('cancer', x)
+        expected = model.predict_proba(scaler.transform(x))
+        assert proba.shape == (10, 2)
+        assert np.allclose(proba, expected, atol=1e-3)
@@ -3,8 +3,9 @@ import os
 import sys
 import numpy as np
 from flask import Flask, render_template, request, jsonify
-import joblib
-import librosa
+import shutil
+import tempfile
+import threading
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,12 +17,9 @@ print(f"✅ Added src to path: {src_path}")
 
 # Now import from src
 from config import Config
-from preprocessor import AudioPreprocessor
-from feature_extractor import FeatureExtractor
-
-import tensorflow as tf
 
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB uploads
 
 # Load model and components
 config = Config()
@@ -29,6 +27,7 @@ config = Config()
 # Update model paths - go up one level from app/ to project root
 model_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models', 'emotion_model.h5'))
 scaler_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models', 'scaler.pkl'))
+tflite_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models', 'emotion_model.tflite'))
 
 print(f"📂 Looking for model at: {model_path}")
 print(f"📂 Looking for scaler at: {scaler_path}")
@@ -44,11 +43,46 @@ if not os.path.exists(scaler_path):
     print("Please train the model first or check the path")
     exit(1)
 
-# Load model and scaler
-model = tf.keras.models.load_model(model_path)
-scaler = joblib.load(scaler_path)
-preprocessor = AudioPreprocessor(config)
-extractor = FeatureExtractor(config)
+class _Resources:
+    """Model, scaler and audio pipeline, loaded once per process on first use"""
+    _lock = threading.Lock()
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        # Heavy imports (TensorFlow, librosa via the audio pipeline) are deferred to
+        # first use so a worker starts serving without loading them
+        import joblib
+        import tensorflow as tf
+        from preprocessor import AudioPreprocessor
+        from feature_extractor import FeatureExtractor
+        from batcher import PredictionBatcher
+        from predictor import TFLiteInference, compile_inference, configure_threads
+        
+        configure_threads()
+        if os.path.exists(tflite_path):
+            # Quantized model from src/export_tflite.py; the .h5 stays the fallback
+            self.model = None
+            self.infer = TFLiteInference(tflite_path)
+        else:
+            self.model = tf.keras.models.load_model(model_path)
+            self.infer = compile_inference(self.model)
+        # StandardScaler baked into a float32 affine transform
+        scaler = joblib.load(scaler_path)
+        self.mean = scaler.mean_.astype(np.float32)
+        self.inv_scale = (1.0 / scaler.scale_).astype(np.float32)
+        self.preprocessor = AudioPreprocessor(config)
+        self.extractor = FeatureExtractor(config)
+        # Concurrent requests share one model call; the batcher's single worker
+        # thread also means only one TF call runs at a time
+        self.batcher = PredictionBatcher(self.infer, batch_size=16, max_latency=0.05)
 
 emotion_names = ['neutral', 'calm', 'happy', 'sad', 
                  'angry', 'fearful', 'disgust', 'surprised']
@@ -73,17 +107,21 @@ def predict():
         return jsonify({'error': 'No audio file'}), 400
     
     audio_file = request.files['audio']
-    temp_path = os.path.join(os.path.dirname(__file__), 'temp_audio.wav')
-    audio_file.save(temp_path)
+    # Stream the upload to a per-request temp file in 64 KB chunks
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+        shutil.copyfileobj(audio_file.stream, f, length=65536)
+        temp_path = f.name
     
     try:
+        resources = _Resources.get()
+        
         # Process audio
-        audio = preprocessor.process(temp_path)
-        features = extractor.extract_all(audio)
-        features_scaled = scaler.transform([features])
+        audio = resources.preprocessor.process(temp_path)
+        features = resources.extractor.extract_all(audio)
+        features_scaled = (features - resources.mean) * resources.inv_scale
         
         # Predict
-        predictions = model.predict(features_scaled, verbose=0)[0]
+        predictions = resources.batcher.predict(features_scaled)
         
         # Get top 3 predictions
         top_3_idx = np.argsort(predictions)[-3:][::-1]
@@ -97,10 +135,6 @@ def predict():
         main_emotion = emotion_names[np.argmax(predictions)]
         main_confidence = float(np.max(predictions))
         
-        # Clean up
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-        
         return jsonify({
             'success': True,
             'main_emotion': main_emotion,
@@ -115,11 +149,12 @@ def predict():
         })
         
     except Exception as e:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
         return jsonify({'error': str(e)}), 500
+    finally:
+        os.remove(temp_path)
 
 if __name__ == '__main__':
     print("🚀 Starting Emotion Recognition Dashboard...")
     print(f"🌐 Open http://localhost:5000 in your browser")
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # The debug reloader would load the model twice; opt in with FLASK_DEBUG=1
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', threaded=True, port=5000)
\ No newline at end of file
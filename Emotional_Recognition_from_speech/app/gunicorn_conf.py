@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the emotion dashboard
+
+Usage (from the project root):
+    gunicorn -c app/gunicorn_conf.py wsgi:app
+"""
+
+import os
+
+chdir = os.path.dirname(os.path.abspath(__file__))
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# One process keeps a single model in memory; its threads share it through
+# the prediction batcher, which serializes TF calls.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+# Room for the TensorFlow import and model load in post_worker_init
+timeout = 120
+
+def post_worker_init(worker):
+    """Load the model before the worker takes requests instead of on the first /predict"""
+    from modern_app import _Resources
+    _Resources.get()
@@ -3,8 +3,11 @@ import os
 import sys
 import numpy as np
 from flask import Flask, render_template, request, jsonify, send_from_directory
-import joblib
 import librosa
+from numba import njit
+import shutil
+import tempfile
+import threading
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -15,8 +18,6 @@ if src_path not in sys.path:
 
 try:
     from config import Config
-    from preprocessor import AudioPreprocessor
-    from feature_extractor import FeatureExtractor
 except:
     class Config:
         SAMPLE_RATE = 22050
@@ -25,11 +26,10 @@ except:
         MONO = True
     Config = Config()
 
-import tensorflow as tf
-
 app = Flask(__name__, 
             template_folder='templates',
             static_folder='static')
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB uploads
 
 config = Config()
 if not hasattr(config, 'MONO'):
@@ -38,60 +38,133 @@ if not hasattr(config, 'MONO'):
 # Load emotion model
 model_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models', 'emotion_model.h5'))
 scaler_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models', 'scaler.pkl'))
+tflite_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'models', 'emotion_model.tflite'))
 
-model = None
-scaler = None
-preprocessor = None
-extractor = None
+class _Resources:
+    """Model, scaler and audio pipeline, loaded once per process on first use"""
+    _lock = threading.Lock()
+    _instance = None
 
-if os.path.exists(model_path) and os.path.exists(scaler_path):
-    try:
-        model = tf.keras.models.load_model(model_path)
+    @classmethod
+    def get(cls):
+        """Shared resources, or None if the model files are missing or failed to load (retried on the next call)"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    try:
+                        if not (os.path.exists(model_path) and os.path.exists(scaler_path)):
+                            raise FileNotFoundError(f"Model files not found under {os.path.dirname(model_path)}")
+                        cls._instance = cls()
+                        print("✅ Emotion model loaded successfully")
+                    except Exception as e:
+                        print(f"❌ Error loading emotion model: {e}")
+        return cls._instance
+
+    def __init__(self):
+        # TensorFlow and the model pipeline are imported on first use so a worker
+        # starts without loading them (librosa is still needed for gender detection)
+        import joblib
+        import tensorflow as tf
+        from preprocessor import AudioPreprocessor
+        from feature_extractor import FeatureExtractor
+        from batcher import PredictionBatcher
+        from predictor import TFLiteInference, compile_inference, configure_threads
+        
+        configure_threads()
+        if os.path.exists(tflite_path):
+            # Quantized model from src/export_tflite.py; the .h5 stays the fallback
+            self.model = None
+            self.infer = TFLiteInference(tflite_path)
+        else:
+            self.model = tf.keras.models.load_model(model_path)
+            self.infer = compile_inference(self.model)
+        # StandardScaler baked into a float32 affine transform
         scaler = joblib.load(scaler_path)
-        preprocessor = AudioPreprocessor(config)
-        extractor = FeatureExtractor(config)
-        print("✅ Emotion model loaded successfully")
-    except Exception as e:
-        print(f"❌ Error loading emotion model: {e}")
+        self.mean = scaler.mean_.astype(np.float32)
+        self.inv_scale = (1.0 / scaler.scale_).astype(np.float32)
+        self.preprocessor = AudioPreprocessor(config)
+        self.extractor = FeatureExtractor(config)
+        # Concurrent requests share one model call; the batcher's single worker
+        # thread also means only one TF call runs at a time
+        self.batcher = PredictionBatcher(self.infer, batch_size=16, max_latency=0.05)
+
+# Voice pitch cues live well below 4 kHz, so pitch analysis runs at 8 kHz
+GENDER_SR = 8000
+
+def pitch_analysis(audio, sr):
+    """
+    STFT magnitude and piptrack pitches of audio downsampled to GENDER_SR
+    Returns: (S, pitches)
+    """
+    audio_ds = librosa.resample(audio, orig_sr=sr, target_sr=GENDER_SR, res_type='polyphase')
+    # 1024 samples at 8 kHz spans about the same time as librosa's default 2048 at 22.05 kHz
+    S = np.abs(librosa.stft(audio_ds, n_fft=1024, hop_length=256))
+    pitches = librosa.piptrack(S=S, sr=GENDER_SR, n_fft=1024, hop_length=256)[0]
+    return S, pitches
+
+GENDER_LABELS = ('unknown', 'male', 'female')
+
+@njit(cache=True)
+def _positive_mean(values):
+    total = 0.0
+    n = 0
+    for v in values:
+        if v > 0:
+            total += v
+            n += 1
+    return total / n if n else 0.0
+
+@njit(cache=True)
+def _zcr(a):
+    c = 0
+    for i in range(1, a.size):
+        c += (a[i - 1] * a[i]) < 0
+    return c / (a.size - 1)
+
+@njit(cache=True)
+def _gender_decide(avg_pitch, centroid, zcr):
+    """Index into GENDER_LABELS"""
+    # Male voices typically: lower pitch (85-180 Hz), lower spectral centroid
+    # Female voices typically: higher pitch (165-255 Hz), higher spectral centroid
+    if avg_pitch < 165 and centroid < 2000:
+        return 1
+    if avg_pitch > 165 and centroid > 2000:
+        return 2
+    # Use the zero-crossing rate for borderline cases
+    if avg_pitch < 180 and zcr < 0.05:
+        return 1
+    if avg_pitch > 160 and zcr > 0.03:
+        return 2
+    return 0
+
+# Compile at startup so the first request doesn't pay for it
+_positive_mean(np.zeros(4, dtype=np.float32))
+_zcr(np.zeros(4, dtype=np.float32))
+_gender_decide(0.0, 0.0, 0.0)
 
 # Gender detection function
-def detect_gender(audio, sr=22050):
+def detect_gender(audio, sr=22050, pitches=None, S=None):
     """
     Detect gender from audio features
+    pitches and S come from pitch_analysis(audio, sr) and are computed here if not given
     Returns: 'male', 'female', or 'unknown'
     """
     try:
-        # Extract pitch-related features
-        pitches, magnitudes = librosa.piptrack(y=audio, sr=sr)
-        pitches = pitches[pitches > 0]
+        if S is None or pitches is None:
+            S, pitches = pitch_analysis(audio, sr)
         
-        if len(pitches) == 0:
+        # Average pitch (fundamental frequency) over voiced bins
+        avg_pitch = _positive_mean(pitches.ravel())
+        if avg_pitch == 0:
             return 'unknown'
         
-        # Average pitch (fundamental frequency)
-        avg_pitch = np.mean(pitches)
-        
-        # Extract spectral features
-        spectral_rolloff = np.mean(librosa.feature.spectral_rolloff(y=audio, sr=sr))
-        spectral_centroid = np.mean(librosa.feature.spectral_centroid(y=audio, sr=sr))
-        
-        # Gender classification logic
-        # Male voices typically: lower pitch (85-180 Hz), lower spectral centroid
-        # Female voices typically: higher pitch (165-255 Hz), higher spectral centroid
+        # Full-rate centroid: at GENDER_SR it would be capped at 4 kHz, below what
+        # the 2000 Hz threshold was tuned on
+        spectral_centroid = float(np.mean(librosa.feature.spectral_centroid(y=audio, sr=sr)))
+        # Time-domain, so kept at the original rate its thresholds assume
+        zero_crossings = _zcr(audio)
         
-        if avg_pitch < 165 and spectral_centroid < 2000:
-            return 'male'
-        elif avg_pitch > 165 and spectral_centroid > 2000:
-            return 'female'
-        else:
-            # Use additional features for borderline cases
-            zero_crossings = np.mean(librosa.feature.zero_crossing_rate(audio))
-            if avg_pitch < 180 and zero_crossings < 0.05:
-                return 'male'
-            elif avg_pitch > 160 and zero_crossings > 0.03:
-                return 'female'
-            else:
-                return 'unknown'
+        return GENDER_LABELS[_gender_decide(avg_pitch, spectral_centroid, zero_crossings)]
     except:
         return 'unknown'
 
@@ -142,34 +215,42 @@ def serve_static(path):
 def health():
     return jsonify({
         'status': 'healthy',
-        'model_loaded': model is not None,
+        # Never loads the model: probes must answer within the HEALTHCHECK timeout
+        'model_loaded': _Resources._instance is not None,
         'emotions': emotion_names
     })
 
 @app.route('/predict', methods=['POST'])
 def predict():
-    if model is None:
+    resources = _Resources.get()
+    if resources is None:
         return jsonify({'error': 'Model not loaded'}), 500
     
     if 'audio' not in request.files:
         return jsonify({'error': 'No audio file'}), 400
     
     audio_file = request.files['audio']
-    temp_path = os.path.join(os.path.dirname(__file__), 'temp.wav')
-    audio_file.save(temp_path)
+    # Stream the upload to a per-request temp file in 64 KB chunks
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+        shutil.copyfileobj(audio_file.stream, f, length=65536)
+        temp_path = f.name
     
     try:
         # Load audio for both emotion and gender detection
-        audio, sr = librosa.load(temp_path, sr=config.SAMPLE_RATE)
+        audio, sr = resources.preprocessor.load(temp_path)
+        
+        # One downsampled STFT and pitch track shared by gender detection and the pitch readout
+        S, pitches = pitch_analysis(audio, sr)
         
         # Gender detection
-        gender = detect_gender(audio, sr)
+        gender = detect_gender(audio, sr, pitches=pitches, S=S)
         
         # Emotion detection
-        processed_audio = preprocessor.process(temp_path)
-        features = extractor.extract_all(processed_audio)
-        features_scaled = scaler.transform([features])
-        predictions = model.predict(features_scaled, verbose=0)[0]
+        # Reuses the decoded audio instead of loading the file again
+        processed_audio = resources.preprocessor.process_array(audio)
+        features = resources.extractor.extract_all(processed_audio)
+        features_scaled = (features - resources.mean) * resources.inv_scale
+        predictions = resources.batcher.predict(features_scaled)
         
         # Get all emotion predictions
         all_preds = []
@@ -191,11 +272,9 @@ def predict():
         audio_features = {
             'duration': len(audio) / sr,
             'sample_rate': sr,
-            'pitch': float(np.mean(librosa.piptrack(y=audio, sr=sr)[0][librosa.piptrack(y=audio, sr=sr)[0] > 0]) or 0)
+            'pitch': float(_positive_mean(pitches.ravel()))
         }
         
-        os.remove(temp_path)
-        
         return jsonify({
             'success': True,
             'main': main,
@@ -209,9 +288,9 @@ def predict():
         })
         
     except Exception as e:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
         return jsonify({'error': str(e)}), 500
+    finally:
+        os.remove(temp_path)
 
 if __name__ == '__main__':
     print("\n" + "="*50)
@@ -219,4 +298,5 @@ if __name__ == '__main__':
     print("="*50)
     print(f"📍 URL: http://localhost:5000")
     print("="*50 + "\n")
-    app.run(debug=True, port=5000, host='127.0.0.1')
\ No newline at end of file
+    # The debug reloader would load the model twice; opt in with FLASK_DEBUG=1
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', threaded=True, port=5000, host='127.0.0.1')
\ No newline at end of file
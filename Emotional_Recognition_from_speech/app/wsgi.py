@@ -0,0 +1,4 @@
+# app/wsgi.py
+# Production entry point:
+#   gunicorn -c app/gunicorn_conf.py wsgi:app
+from modern_app import app  # noqa: F401  (re-exported for gunicorn)
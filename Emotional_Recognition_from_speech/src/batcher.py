@@ -0,0 +1,44 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+class PredictionBatcher:
+    """Collects concurrent single-row requests and runs them as one batched predict call"""
+
+    def __init__(self, predict_batch, batch_size=16, max_latency=0.05):
+        self.predict_batch = predict_batch
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='prediction-batcher', daemon=True)
+        self._thread.start()
+
+    def predict(self, features):
+        """Blocks until the batch holding this row has run; returns its output row"""
+        future = Future()
+        self._queue.put((np.asarray(features, dtype=np.float32), future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Wait up to max_latency after the first request for others to share the call
+            deadline = time.monotonic() + self.max_latency
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                pass
+
+            rows, futures = zip(*batch)
+            try:
+                outputs = self.predict_batch(np.vstack(rows))
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            for future, output in zip(futures, outputs):
+                future.set_result(output)
@@ -7,6 +7,7 @@ class Config:
     SAMPLE_RATE = 22050
     DURATION = 3
     MONO = True  # ADD THIS LINE
+    USE_NR = False  # Noise reduction; off to match training (the notebook never denoised)
     
     # Feature extraction
     N_MFCC = 40
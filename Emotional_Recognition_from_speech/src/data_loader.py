@@ -1,23 +1,35 @@
 import os
 import pandas as pd
 
+def _iter_wav_files(path):
+    """Recursive os.scandir walk yielding (filepath, filename) of .wav files"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _iter_wav_files(entry.path)
+            elif entry.is_file() and entry.name.endswith('.wav'):
+                yield entry.path, entry.name
+
 class RAVDESSLoader:
     def __init__(self, config):
         self.config = config
     
     def load_metadata(self):
-        records = []
-        for root, _, files in os.walk(self.config.RAVDESS_PATH):
-            for file in files:
-                if file.endswith('.wav'):
-                    parts = file.split('-')
-                    if len(parts) >= 3:
-                        records.append({
-                            'filepath': os.path.join(root, file),
-                            'emotion': self.config.EMOTION_MAP.get(parts[2], 'unknown'),
-                            'actor': parts[6] if len(parts) > 6 else 'unknown'
-                        })
+        filepaths, emotions, actors = [], [], []
+        for filepath, file in _iter_wav_files(self.config.RAVDESS_PATH):
+            parts = file.split('-')
+            if len(parts) >= 3:
+                filepaths.append(filepath)
+                emotions.append(self.config.EMOTION_MAP.get(parts[2], 'unknown'))
+                actors.append(parts[6] if len(parts) > 6 else 'unknown')
         
-        df = pd.DataFrame(records)
-        df['emotion_label'] = pd.Categorical(df['emotion']).codes
+        # Codes follow EMOTION_MAP order, the order the apps and EmotionPredictor decode with
+        categories = list(self.config.EMOTION_MAP.values()) + ['unknown']
+        emotion = pd.Categorical(emotions, categories=categories)
+        df = pd.DataFrame({
+            'filepath': filepaths,
+            'emotion': emotions,
+            'actor': actors,
+            'emotion_label': emotion.codes
+        })
         return df
\ No newline at end of file
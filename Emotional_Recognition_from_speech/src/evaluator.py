@@ -4,9 +4,12 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 class ModelEvaluator:
-    def evaluate(self, model, X_test, y_test, emotion_names):
-        y_pred = model.predict(X_test)
-        y_pred_classes = np.argmax(y_pred, axis=1)
+    def evaluate(self, model, X_test, y_test, emotion_names, batch_size=256):
+        # Argmax per batch; the full probability matrix is never materialized
+        y_pred_classes = np.empty(len(X_test), dtype=np.int8)
+        for i in range(0, len(X_test), batch_size):
+            probs = model(X_test[i:i + batch_size], training=False).numpy()
+            y_pred_classes[i:i + batch_size] = np.argmax(probs, axis=1)
         y_true_classes = np.argmax(y_test, axis=1)
         
         report = classification_report(y_true_classes, y_pred_classes, 
@@ -0,0 +1,38 @@
+import argparse
+import numpy as np
+import tensorflow as tf
+
+def export_tflite(model_path, output_path, calibration_path=None):
+    """
+    Convert the Keras model to a quantized TFLite flatbuffer
+    
+    With calibration_path (a .npy of ~100 scaled feature rows) weights and
+    activations are quantized to int8; without it, dynamic-range quantization
+    (int8 weights, float activations) is used. Inputs and outputs stay float32.
+    """
+    model = tf.keras.models.load_model(model_path)
+    
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    
+    if calibration_path:
+        calibration = np.load(calibration_path).astype(np.float32)
+        
+        def representative_dataset():
+            for row in calibration[:100]:
+                yield [row[np.newaxis, :]]
+        
+        converter.representative_dataset = representative_dataset
+    
+    with open(output_path, 'wb') as f:
+        f.write(converter.convert())
+    print(f"✅ TFLite model saved to {output_path}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export the emotion model to TFLite')
+    parser.add_argument('--model', default='models/emotion_model.h5')
+    parser.add_argument('--output', default='models/emotion_model.tflite')
+    parser.add_argument('--calibration', default=None,
+                        help='.npy of scaled feature rows for full int8 quantization')
+    args = parser.parse_args()
+    export_tflite(args.model, args.output, args.calibration)
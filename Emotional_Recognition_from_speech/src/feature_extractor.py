@@ -1,25 +1,87 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import librosa
 import numpy as np
 
+# librosa's frame settings for zero_crossing_rate / rms
+FRAME_LENGTH = 2048
+FRAME_HOP = 512
+
 class FeatureExtractor:
     def __init__(self, config):
         self.config = config
+
+    def power_spectrogram(self, audio):
+        return np.abs(librosa.stft(audio, n_fft=2048, hop_length=self.config.HOP_LENGTH)) ** 2
+
+    def extract_mfcc(self, audio, S=None):
+        """Mean MFCCs; S is a precomputed power spectrogram of audio"""
+        if S is None:
+            S = self.power_spectrogram(audio)
+        mel = librosa.feature.melspectrogram(S=S, sr=self.config.SAMPLE_RATE,
+                                             n_mels=self.config.N_MELS)
+        mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=self.config.N_MFCC)
+        return np.mean(mfccs, axis=1)
+
+    def extract_all(self, audio):
+        n_mfcc = self.config.N_MFCC
+        features = np.empty(n_mfcc + 2, dtype=np.float32)
+        features[:n_mfcc] = self.extract_mfcc(audio, self.power_spectrogram(audio))
+
+        # ZCR and RMS from one framing pass (centered, zero-padded like librosa.feature.rms)
+        frames = librosa.util.frame(np.pad(audio, FRAME_LENGTH // 2),
+                                    frame_length=FRAME_LENGTH, hop_length=FRAME_HOP)
+
+        signs = np.signbit(np.where(np.abs(frames) <= 1e-10, 0, frames))
+        zcr = np.count_nonzero(signs[1:] != signs[:-1], axis=0) / FRAME_LENGTH
+        features[n_mfcc] = np.mean(zcr)
+
+        rms = np.sqrt(np.mean(np.abs(frames) ** 2, axis=0))
+        features[n_mfcc + 1] = np.mean(rms)
+
+        return features
+
+def _extract_one(filepath, config):
+    """Preprocess and featurize one file; runs in a worker process"""
+    from preprocessor import AudioPreprocessor
+    audio = AudioPreprocessor(config).process(filepath)
+    return FeatureExtractor(config).extract_all(audio)
+
+def extract_dataset(df, config, max_workers=None):
+    """Feature matrix (n_files, N_MFCC + 2) for df['filepath'], extracted across CPU cores"""
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        feats = list(ex.map(partial(_extract_one, config=config), df['filepath'], chunksize=16))
+    return np.stack(feats).astype(np.float32)
+
+# Config fields that change what extract_dataset produces
+FEATURE_CONFIG = ('SAMPLE_RATE', 'DURATION', 'MONO', 'USE_NR', 'N_MFCC', 'N_MELS', 'HOP_LENGTH')
+
+def _cache_key(df, config):
+    """Hash of the (sorted) files, their labels and the feature-relevant config"""
+    h = hashlib.sha1()
+    for filepath, label in zip(df['filepath'], df['emotion_label']):
+        h.update(f'{filepath}\0{label}\n'.encode())
+    h.update(repr([(name, getattr(config, name, None)) for name in FEATURE_CONFIG]).encode())
+    return h.hexdigest()[:16]
+
+def cached_dataset(df, config, cache_dir='cache'):
+    """
+    (X, y) for df sorted by filepath, extracted once into float32/int8 .npy
+    files under cache_dir and memory-mapped on later runs. The file names
+    carry a hash of the files, labels and feature config, so any change to
+    those re-extracts instead of reusing stale features.
+    """
+    df = df.sort_values('filepath')
+    key = _cache_key(df, config)
+    X_path = os.path.join(cache_dir, f'X-{key}.npy')
+    y_path = os.path.join(cache_dir, f'y-{key}.npy')
     
-    def extract_mfcc(self, audio):
-        mfccs = librosa.feature.mfcc(y=audio, sr=self.config.SAMPLE_RATE, 
-                                    n_mfcc=self.config.N_MFCC,
-                                    hop_length=self.config.HOP_LENGTH)
-        return np.mean(mfccs.T, axis=0)
+    if not (os.path.exists(X_path) and os.path.exists(y_path)):
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(X_path, extract_dataset(df, config))
+        np.save(y_path, np.asarray(df['emotion_label'], dtype=np.int8))
     
-    def extract_all(self, audio):
-        features = []
-        features.extend(self.extract_mfcc(audio))
-        
-        # Add more features if needed
-        zcr = librosa.feature.zero_crossing_rate(audio)
-        features.append(np.mean(zcr))
-        
-        rms = librosa.feature.rms(y=audio)
-        features.append(np.mean(rms))
-        
-        return np.array(features)
\ No newline at end of file
+    return np.load(X_path, mmap_mode='r'), np.load(y_path, mmap_mode='r')
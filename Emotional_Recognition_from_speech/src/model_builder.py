@@ -22,6 +22,7 @@ class EmotionRecognitionModel:
             
             # ✅ PREPARE FOR LSTM
             layers.Reshape((-1, 64)),
+            # Input dropout keeps the fused CuDNN kernel; only recurrent_dropout would disable it
             layers.LSTM(64, return_sequences=True, dropout=0.2),
             layers.LSTM(32, dropout=0.2),
             
@@ -1,11 +1,49 @@
+import os
 import tensorflow as tf
 import numpy as np
 import joblib
 
+def compile_inference(model):
+    """Trace the forward pass once; skips model.predict's per-call Python overhead"""
+    n_features = model.input_shape[-1]
+    infer = tf.function(lambda x: model(x, training=False)).get_concrete_function(
+        tf.TensorSpec([None, n_features], tf.float32)
+    )
+    return lambda x: infer(tf.constant(x, dtype=tf.float32)).numpy()
+
+def configure_threads(intra_op=None, inter_op=2):
+    """Size TF's thread pools for serving; must run before the first TF op"""
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op or max(1, (os.cpu_count() or 2) // 2))
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op)
+
+class TFLiteInference:
+    """Scaled features -> probabilities through a TFLite interpreter (not thread-safe)"""
+    
+    def __init__(self, model_path, num_threads=None):
+        self.interpreter = tf.lite.Interpreter(model_path=str(model_path),
+                                               num_threads=num_threads or os.cpu_count())
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+    
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        if tuple(self._input['shape']) != x.shape:
+            # Reallocate only when the batch size changes
+            self.interpreter.resize_tensor_input(self._input['index'], x.shape)
+            self.interpreter.allocate_tensors()
+            self._input = self.interpreter.get_input_details()[0]
+        self.interpreter.set_tensor(self._input['index'], x)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output['index'])
+
 class EmotionPredictor:
     def __init__(self, model_path, scaler_path, config):
         self.model = tf.keras.models.load_model(model_path)
-        self.scaler = joblib.load(scaler_path)
+        self.infer = compile_inference(self.model)
+        scaler = joblib.load(scaler_path)
+        self.mean = scaler.mean_.astype(np.float32)
+        self.inv_scale = (1.0 / scaler.scale_).astype(np.float32)
         self.config = config
         
         from .preprocessor import AudioPreprocessor
@@ -18,9 +56,9 @@ class EmotionPredictor:
     def predict(self, audio_file):
         audio = self.preprocessor.process(audio_file)
         features = self.feature_extractor.extract_all(audio)
-        features_scaled = self.scaler.transform([features])
+        features_scaled = ((features - self.mean) * self.inv_scale).reshape(1, -1)
         
-        predictions = self.model.predict(features_scaled, verbose=0)[0]
+        predictions = self.infer(features_scaled)[0]
         emotion_idx = np.argmax(predictions)
         
         return {
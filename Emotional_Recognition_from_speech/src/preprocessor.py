@@ -1,21 +1,53 @@
 import librosa
 import numpy as np
-import noisereduce as nr
+import soundfile as sf
+from scipy.signal import resample_poly
 
 class AudioPreprocessor:
     def __init__(self, config):
         self.config = config
     
+    def load(self, filepath, duration=None):
+        """
+        Read up to `duration` seconds (all if None) resampled to SAMPLE_RATE
+        Returns: (audio, sr)
+        """
+        sr = self.config.SAMPLE_RATE
+        try:
+            with sf.SoundFile(filepath) as f:
+                native_sr = f.samplerate
+                # Only the needed frames are decoded
+                frames = -1 if duration is None else int(duration * native_sr)
+                audio = f.read(frames=frames, dtype='float32', always_2d=True)
+        except RuntimeError:
+            # Formats libsndfile can't decode (LibsndfileError is a RuntimeError)
+            # go through librosa's audioread fallback
+            return librosa.load(filepath, sr=sr, duration=duration, mono=self.config.MONO)
+        
+        audio = audio.mean(axis=1) if self.config.MONO else audio.T
+        if native_sr != sr:
+            audio = resample_poly(audio, sr, native_sr, axis=-1).astype(np.float32)
+        return audio, sr
+    
     def process(self, filepath):
-        audio, sr = librosa.load(filepath, sr=self.config.SAMPLE_RATE, 
-                                duration=self.config.DURATION, mono=self.config.MONO)
-        audio = nr.reduce_noise(y=audio, sr=sr)
+        audio, sr = self.load(filepath, duration=self.config.DURATION)
+        return self.process_array(audio)
+    
+    def process_array(self, audio):
+        """Denoise, normalize and pad/crop audio already loaded at SAMPLE_RATE"""
+        target_len = self.config.SAMPLE_RATE * self.config.DURATION
+        # Same window process() loads with duration=DURATION
+        audio = audio[:target_len]
+        
+        if getattr(self.config, 'USE_NR', False):
+            import noisereduce as nr
+            audio = nr.reduce_noise(y=audio, sr=self.config.SAMPLE_RATE, stationary=True)
         audio = librosa.util.normalize(audio)
         
-        target_len = self.config.SAMPLE_RATE * self.config.DURATION
-        if len(audio) > target_len:
-            audio = audio[:target_len]
-        else:
-            audio = np.pad(audio, (0, target_len - len(audio)))
+        if len(audio) < target_len:
+            # Single zeroed allocation, not shared, so concurrent requests stay safe
+            out = np.zeros(target_len, dtype=np.float32)
+            out[:len(audio)] = audio
+            audio = out
         
         return audio
\ No newline at end of file
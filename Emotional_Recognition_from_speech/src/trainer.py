@@ -5,6 +5,37 @@ class ModelTrainer:
     def __init__(self, config):
         self.config = config
     
+    def make_dataset(self, X, y, shuffle=False):
+        """
+        Batched, prefetched tf.data pipeline so input copies overlap with compute.
+        A memory-mapped X (e.g. from feature_extractor.cached_dataset) is read
+        one batch at a time instead of being copied whole into a tensor.
+        """
+        if not isinstance(X, np.memmap):
+            dataset = tf.data.Dataset.from_tensor_slices((np.asarray(X, dtype=np.float32), y))
+            if shuffle:
+                dataset = dataset.shuffle(len(X), reshuffle_each_iteration=True)
+            return dataset.batch(self.config.BATCH_SIZE).prefetch(tf.data.AUTOTUNE)
+        
+        y = np.asarray(y)
+        
+        def gather(idx):
+            idx = np.sort(idx)  # sequential reads from the memmap
+            return np.asarray(X[idx], dtype=np.float32), y[idx]
+        
+        def load_batch(idx):
+            X_batch, y_batch = tf.numpy_function(gather, [idx], (tf.float32, tf.as_dtype(y.dtype)))
+            X_batch.set_shape((None,) + X.shape[1:])
+            y_batch.set_shape((None,) + y.shape[1:])
+            return X_batch, y_batch
+        
+        indices = tf.data.Dataset.range(len(X))
+        if shuffle:
+            indices = indices.shuffle(len(X), reshuffle_each_iteration=True)
+        return (indices.batch(self.config.BATCH_SIZE)
+                .map(load_batch, num_parallel_calls=tf.data.AUTOTUNE)
+                .prefetch(tf.data.AUTOTUNE))
+    
     def train(self, model, X_train, y_train, X_val, y_val):
         callbacks = [
             tf.keras.callbacks.EarlyStopping(
@@ -20,10 +51,9 @@ class ModelTrainer:
         ]
         
         history = model.fit(
-            X_train, y_train,
-            validation_data=(X_val, y_val),
+            self.make_dataset(X_train, y_train, shuffle=True),
+            validation_data=self.make_dataset(X_val, y_val),
             epochs=self.config.EPOCHS,
-            batch_size=self.config.BATCH_SIZE,
             callbacks=callbacks,
             verbose=1
         )
@@ -0,0 +1,39 @@
+import threading
+import numpy as np
+import pytest
+import sys
+sys.path.append('src')
+from batcher import PredictionBatcher
+
+class TestPredictionBatcher:
+    def test_concurrent_requests_share_a_call(self):
+        """Rows submitted together run in one call and each caller gets its own row back"""
+        calls = []
+        def predict_batch(x):
+            calls.append(len(x))
+            return x * 2
+        
+        batcher = PredictionBatcher(predict_batch, batch_size=8, max_latency=0.2)
+        results = [None] * 8
+        def submit(i):
+            results[i] = batcher.predict(np.full(42, i))
+        
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        for i, row in enumerate(results):
+            assert np.all(row == 2 * i)
+        assert sum(calls) == 8
+        assert len(calls) < 8
+        
+    def test_errors_reach_the_caller(self):
+        """A failing batch raises in every waiting request"""
+        def predict_batch(x):
+            raise ValueError('bad input')
+        
+        batcher = PredictionBatcher(predict_batch, max_latency=0.01)
+        with pytest.raises(ValueError):
+            batcher.predict(np.zeros(42))
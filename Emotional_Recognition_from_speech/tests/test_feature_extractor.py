@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+import soundfile as sf
+import sys
+sys.path.append('src')
+from config import Config
+from preprocessor import AudioPreprocessor
+from feature_extractor import FeatureExtractor, extract_dataset
+
+class TestExtractDataset:
+    def test_matches_single_file_extraction(self, tmp_path):
+        """Worker-process extraction of a generated WAV matches the in-process pipeline"""
+        config = Config()
+        t = np.arange(config.SAMPLE_RATE * 2) / config.SAMPLE_RATE
+        filepath = str(tmp_path / 'tone.wav')
+        sf.write(filepath, 0.5 * np.sin(2 * np.pi * 220 * t), config.SAMPLE_RATE)
+        
+        X = extract_dataset(pd.DataFrame({'filepath': [filepath]}), config, max_workers=1)
+        
+        expected = FeatureExtractor(config).extract_all(AudioPreprocessor(config).process(filepath))
+        assert X.shape == (1, config.N_MFCC + 2)
+        assert X.dtype == np.float32
+        assert np.allclose(X[0], expected)
@@ -0,0 +1,42 @@
+import librosa
+import numpy as np
+import pytest
+import sys
+sys.path.append('app')
+from modern_app import detect_gender
+
+SR = 22050
+
+def reference_gender(audio, sr):
+    """Full-rate detect_gender the 165 Hz / 2000 Hz thresholds were tuned on"""
+    pitches = librosa.piptrack(y=audio, sr=sr)[0]
+    pitches = pitches[pitches > 0]
+    if len(pitches) == 0:
+        return 'unknown'
+    avg_pitch = np.mean(pitches)
+    spectral_centroid = np.mean(librosa.feature.spectral_centroid(y=audio, sr=sr))
+    if avg_pitch < 165 and spectral_centroid < 2000:
+        return 'male'
+    if avg_pitch > 165 and spectral_centroid > 2000:
+        return 'female'
+    zero_crossings = np.mean(librosa.feature.zero_crossing_rate(audio))
+    if avg_pitch < 180 and zero_crossings < 0.05:
+        return 'male'
+    if avg_pitch > 160 and zero_crossings > 0.03:
+        return 'female'
+    return 'unknown'
+
+def voiced_clip(f0, n_harmonics, seconds=2):
+    """Harmonic stack with 1/k amplitudes, a stand-in for a sustained vowel"""
+    t = np.arange(int(SR * seconds)) / SR
+    audio = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, n_harmonics + 1))
+    return (0.5 * audio / np.max(np.abs(audio))).astype(np.float32)
+
+class TestDetectGender:
+    @pytest.mark.parametrize('f0, n_harmonics', [
+        (110, 10), (120, 30), (150, 20), (170, 15), (210, 20), (230, 40)
+    ])
+    def test_matches_full_rate_reference(self, f0, n_harmonics):
+        """The 8 kHz pitch path gives the same label as full-rate analysis"""
+        audio = voiced_clip(f0, n_harmonics)
+        assert detect_gender(audio, SR) == reference_gender(audio, SR)